@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from argent.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'a1b2c3d4e5f6'
@@ -21,10 +23,15 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Add external_id column to messages table."""
     op.add_column('messages', sa.Column('external_id', sa.Text(), nullable=True))
-    op.create_index('idx_messages_external_id', 'messages', ['external_id'], unique=False)
+
+    # Only messages from external providers carry an external_id, so index
+    # just those rows. Built without holding a write lock on messages.
+    create_index_concurrently(
+        "idx_messages_external_id", "ON messages (external_id) WHERE external_id IS NOT NULL"
+    )
 
 
 def downgrade() -> None:
     """Remove external_id column from messages table."""
-    op.drop_index('idx_messages_external_id', table_name='messages')
+    drop_index_concurrently('idx_messages_external_id')
     op.drop_column('messages', 'external_id')
@@ -3,6 +3,12 @@
 Revision ID: b2c3d4e5f6g7
 Revises: a1b2c3d4e5f6
 Create Date: 2025-12-20 20:00:00.000000
+
+First of three phases replacing Telegram with phone (add -> backfill ->
+drop), so app instances still running mid-deploy keep working:
+- b2c3d4e5f6g7: add the phone columns (this revision)
+- b3c4d5e6f7g8: move existing telegram messages to the sms channel
+- b4c5d6e7f8g9: drop the Telegram columns
 """
 
 from typing import Sequence, Union
@@ -10,6 +16,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from argent.migration_helpers import create_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = 'b2c3d4e5f6g7'
@@ -19,34 +27,20 @@ depends_on: Union[str, Sequence[str], None] = None
 
 
 def upgrade() -> None:
-    """Replace Telegram fields with phone fields."""
-    # Add new phone columns
+    """Add phone fields alongside the Telegram fields."""
     op.add_column('players', sa.Column('phone', sa.Text(), nullable=True))
     op.add_column('players', sa.Column('phone_verified', sa.Boolean(), nullable=False, server_default='false'))
-    op.create_unique_constraint('uq_players_phone', 'players', ['phone'])
 
-    # Remove Telegram columns
-    op.drop_constraint('players_telegram_id_key', 'players', type_='unique')
-    op.drop_column('players', 'telegram_id')
-    op.drop_column('players', 'telegram_username')
-    op.drop_column('players', 'telegram_verified')
-
-    # Update messages channel enum - change 'telegram' to 'sms' in existing data
-    op.execute("UPDATE messages SET channel = 'sms' WHERE channel = 'telegram'")
+    # Build the unique index without blocking signups, then attach it as the
+    # constraint (a catalog-only change; the index is renamed to match)
+    create_index_concurrently("uq_players_phone_idx", "ON players (phone)", unique=True)
+    op.execute(
+        "ALTER TABLE players ADD CONSTRAINT uq_players_phone UNIQUE USING INDEX uq_players_phone_idx"
+    )
 
 
 def downgrade() -> None:
-    """Restore Telegram fields from phone fields."""
-    # Add Telegram columns back
-    op.add_column('players', sa.Column('telegram_verified', sa.Boolean(), nullable=False, server_default='false'))
-    op.add_column('players', sa.Column('telegram_username', sa.Text(), nullable=True))
-    op.add_column('players', sa.Column('telegram_id', sa.BigInteger(), nullable=True))
-    op.create_unique_constraint('players_telegram_id_key', 'players', ['telegram_id'])
-
-    # Remove phone columns
+    """Remove phone fields."""
     op.drop_constraint('uq_players_phone', 'players', type_='unique')
     op.drop_column('players', 'phone_verified')
     op.drop_column('players', 'phone')
-
-    # Revert messages channel
-    op.execute("UPDATE messages SET channel = 'telegram' WHERE channel = 'sms'")
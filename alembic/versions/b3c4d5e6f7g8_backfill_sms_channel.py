@@ -0,0 +1,69 @@
+"""backfill_sms_channel
+
+Revision ID: b3c4d5e6f7g8
+Revises: b2c3d4e5f6g7
+Create Date: 2025-12-20 20:00:01.000000
+
+Second phase of replacing Telegram with phone: move existing messages
+from the 'telegram' channel to 'sms'. Telegram IDs have no phone
+equivalent, so players.phone is left for players to verify themselves.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3c4d5e6f7g8'
+down_revision: Union[str, None] = 'b2c3d4e5f6g7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows rewritten per autocommitted batch when migrating message channels
+CHANNEL_BATCH_SIZE = 10000
+
+
+def _rechannel_messages(old_channel: str, new_channel: str) -> None:
+    """Move messages from one channel to another in bounded batches.
+
+    Each batch locks and rewrites up to CHANNEL_BATCH_SIZE rows still on
+    the old channel; moved rows no longer match, so the next batch picks
+    up where this one left off without a key cursor.
+
+    Each batch commits on its own, so row locks and WAL are released
+    frequently instead of being held until the migration finishes. Rows
+    locked by other transactions are waited for, not skipped, so an empty
+    batch means no row is left on the old channel.
+    """
+    conn = op.get_bind()
+    batch = sa.text(
+        "WITH c AS ("
+        "SELECT id FROM messages WHERE channel = :old_channel "
+        "LIMIT :batch_size FOR UPDATE"
+        ") "
+        "UPDATE messages m SET channel = :new_channel FROM c WHERE m.id = c.id RETURNING 1"
+    )
+    with op.get_context().autocommit_block():
+        while True:
+            result = conn.execute(
+                batch,
+                {
+                    "old_channel": old_channel,
+                    "new_channel": new_channel,
+                    "batch_size": CHANNEL_BATCH_SIZE,
+                },
+            )
+            if result.rowcount == 0:
+                break
+
+
+def upgrade() -> None:
+    """Change 'telegram' to 'sms' in existing message data."""
+    _rechannel_messages("telegram", "sms")
+
+
+def downgrade() -> None:
+    """Revert messages channel."""
+    _rechannel_messages("sms", "telegram")
@@ -0,0 +1,45 @@
+"""drop_telegram_columns
+
+Revision ID: b4c5d6e7f8g9
+Revises: b3c4d5e6f7g8
+Create Date: 2025-12-20 20:00:02.000000
+
+Final phase of replacing Telegram with phone. Deploy once no running app
+instance reads the Telegram columns any more.
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b4c5d6e7f8g9'
+down_revision: Union[str, None] = 'b3c4d5e6f7g8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Remove Telegram fields."""
+    # Databases migrated by the original single-step b2c3d4e5f6g7 already
+    # dropped these, so every drop is conditional. One ALTER TABLE so the
+    # ACCESS EXCLUSIVE lock is taken only once.
+    op.execute(
+        """
+        ALTER TABLE players
+            DROP CONSTRAINT IF EXISTS players_telegram_id_key,
+            DROP COLUMN IF EXISTS telegram_id,
+            DROP COLUMN IF EXISTS telegram_username,
+            DROP COLUMN IF EXISTS telegram_verified
+        """
+    )
+
+
+def downgrade() -> None:
+    """Restore Telegram fields."""
+    op.add_column('players', sa.Column('telegram_verified', sa.Boolean(), nullable=False, server_default='false'))
+    op.add_column('players', sa.Column('telegram_username', sa.Text(), nullable=True))
+    op.add_column('players', sa.Column('telegram_id', sa.BigInteger(), nullable=True))
+    op.create_unique_constraint('players_telegram_id_key', 'players', ['telegram_id'])
@@ -1,7 +1,7 @@
 """add_verification_tokens
 
 Revision ID: c3d4e5f6g7h8
-Revises: b2c3d4e5f6g7
+Revises: b4c5d6e7f8g9
 Create Date: 2025-12-21 15:00:00.000000
 """
 
@@ -11,19 +11,43 @@ from alembic import op
 import sqlalchemy as sa
 from sqlalchemy.dialects.postgresql import UUID
 
+from argent.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = "c3d4e5f6g7h8"
-down_revision: Union[str, None] = "b2c3d4e5f6g7"
+down_revision: Union[str, None] = "b4c5d6e7f8g9"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+VERIFICATION_TOKEN_INDEXES = (
+    # Index for efficient token lookup (only active tokens)
+    (
+        "idx_verification_tokens_lookup",
+        "ON verification_tokens (token_type, token_value) WHERE used_at IS NULL",
+    ),
+    # Index for efficient expiry cleanup (only active tokens)
+    (
+        "idx_verification_tokens_expiry",
+        "ON verification_tokens (expires_at) WHERE used_at IS NULL",
+    ),
+    # Index for finding active tokens by player (rate limiting, invalidation).
+    # Covers expires_at/created_at so those lookups are index-only.
+    (
+        "idx_verification_tokens_player",
+        "ON verification_tokens (player_id, token_type) "
+        "INCLUDE (expires_at, created_at) WHERE used_at IS NULL",
+    ),
+)
+
 
 def upgrade() -> None:
     """Create verification_tokens table for email and phone verification."""
     op.create_table(
         "verification_tokens",
         sa.Column("id", UUID(as_uuid=True), primary_key=True),
+        # Inline FK is fine here: the table is empty when created. For FKs
+        # on populated tables use argent.migration_helpers.add_fk_nonblocking.
         sa.Column(
             "player_id",
             UUID(as_uuid=True),
@@ -42,37 +66,21 @@ def upgrade() -> None:
         ),
     )
 
-    # Index for efficient token lookup (only active tokens)
-    op.execute(
-        """
-        CREATE INDEX idx_verification_tokens_lookup
-        ON verification_tokens (token_type, token_value)
-        WHERE used_at IS NULL
-        """
-    )
+    # Give the index builds more memory and parallel workers. Plain SET is
+    # session-scoped, so it also applies to the autocommit blocks below.
+    op.execute("SET maintenance_work_mem = '1GB'")
+    op.execute("SET max_parallel_maintenance_workers = 4")
 
-    # Index for efficient expiry cleanup (only active tokens)
-    op.execute(
-        """
-        CREATE INDEX idx_verification_tokens_expiry
-        ON verification_tokens (expires_at)
-        WHERE used_at IS NULL
-        """
-    )
+    # Each concurrent build runs in an autocommit block of its own
+    for name, definition in VERIFICATION_TOKEN_INDEXES:
+        create_index_concurrently(name, definition)
 
-    # Index for finding active tokens by player (rate limiting, invalidation)
-    op.execute(
-        """
-        CREATE INDEX idx_verification_tokens_player
-        ON verification_tokens (player_id, token_type)
-        WHERE used_at IS NULL
-        """
-    )
+    op.execute("RESET max_parallel_maintenance_workers")
+    op.execute("RESET maintenance_work_mem")
 
 
 def downgrade() -> None:
     """Drop verification_tokens table."""
-    op.drop_index("idx_verification_tokens_player", table_name="verification_tokens")
-    op.drop_index("idx_verification_tokens_expiry", table_name="verification_tokens")
-    op.drop_index("idx_verification_tokens_lookup", table_name="verification_tokens")
+    for name, _ in reversed(VERIFICATION_TOKEN_INDEXES):
+        drop_index_concurrently(name)
     op.drop_table("verification_tokens")
@@ -10,6 +10,8 @@ from typing import Sequence, Union
 from alembic import op
 import sqlalchemy as sa
 
+from argent.migration_helpers import create_index_concurrently, drop_index_concurrently
+
 
 # revision identifiers, used by Alembic.
 revision: str = "d4e5f6g7h8i9"
@@ -20,27 +22,60 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     """Add web inbox support columns to players and messages tables."""
+    # messages gets content backfilled and read_at updated for web-only
+    # players. Leave free space in each page so those UPDATEs can stay HOT.
+    # Only newly written pages honour this; run VACUUM FULL out of band to
+    # repack existing rows.
+    op.execute("ALTER TABLE messages SET (fillfactor = 85)")
+
     # Add communication_mode to players (immersive or web_only)
     op.add_column(
         "players",
         sa.Column("communication_mode", sa.Text(), server_default="immersive", nullable=False),
     )
+    # The server default only exists to fill existing rows (metadata-only on
+    # PG 11+). The ORM always sets the value, so drop it again. On a large
+    # table, use add-nullable -> batched backfill -> SET NOT NULL instead.
+    op.execute("ALTER TABLE players ALTER COLUMN communication_mode DROP DEFAULT")
+
+    # Restrict communication_mode to known values. NOT VALID skips the scan
+    # under the exclusive lock; VALIDATE only takes SHARE UPDATE EXCLUSIVE.
+    op.execute(
+        "ALTER TABLE players ADD CONSTRAINT ck_players_comm_mode "
+        "CHECK (communication_mode IN ('immersive', 'web_only')) NOT VALID"
+    )
+    with op.get_context().autocommit_block():
+        op.execute("ALTER TABLE players VALIDATE CONSTRAINT ck_players_comm_mode")
 
     # Add content columns to messages for web_only mode
-    op.add_column("messages", sa.Column("subject", sa.Text(), nullable=True))
-    op.add_column("messages", sa.Column("content", sa.Text(), nullable=True))
-    op.add_column("messages", sa.Column("html_content", sa.Text(), nullable=True))
-    op.add_column("messages", sa.Column("sender_name", sa.Text(), nullable=True))
+    # One ALTER TABLE so the ACCESS EXCLUSIVE lock is taken only once
+    op.execute(
+        """
+        ALTER TABLE messages
+            ADD COLUMN subject TEXT,
+            ADD COLUMN content TEXT,
+            ADD COLUMN html_content TEXT,
+            ADD COLUMN sender_name TEXT
+        """
+    )
 
     # Add index for session-based message grouping (conversation threading)
-    op.create_index("idx_messages_session", "messages", ["session_id"], unique=False)
+    # Built concurrently so inserts into messages are not blocked meanwhile
+    create_index_concurrently("idx_messages_session", "ON messages (session_id)")
 
 
 def downgrade() -> None:
     """Remove web inbox support columns."""
-    op.drop_index("idx_messages_session", table_name="messages")
-    op.drop_column("messages", "sender_name")
-    op.drop_column("messages", "html_content")
-    op.drop_column("messages", "content")
-    op.drop_column("messages", "subject")
+    drop_index_concurrently("idx_messages_session")
+    op.execute(
+        """
+        ALTER TABLE messages
+            DROP COLUMN sender_name,
+            DROP COLUMN html_content,
+            DROP COLUMN content,
+            DROP COLUMN subject
+        """
+    )
+    op.drop_constraint("ck_players_comm_mode", "players", type_="check")
     op.drop_column("players", "communication_mode")
+    op.execute("ALTER TABLE messages RESET (fillfactor)")
@@ -0,0 +1,33 @@
+"""add_message_conversation_index
+
+Revision ID: e5f6g7h8i9j0
+Revises: d4e5f6g7h8i9
+Create Date: 2026-10-16 10:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from argent.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e5f6g7h8i9j0"
+down_revision: Union[str, None] = "d4e5f6g7h8i9"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index messages by player, conversation and time."""
+    # Conversation reads filter on (player_id, session_id) and order by
+    # created_at, often with a LIMIT. Built without holding a write lock.
+    create_index_concurrently(
+        "idx_messages_player_session_created", "ON messages (player_id, session_id, created_at)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the conversation index."""
+    drop_index_concurrently("idx_messages_player_session_created")
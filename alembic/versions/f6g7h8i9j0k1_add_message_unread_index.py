@@ -0,0 +1,35 @@
+"""add_message_unread_index
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from argent.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f6g7h8i9j0k1"
+down_revision: Union[str, None] = "e5f6g7h8i9j0"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index unread agent messages by player and channel."""
+    # Every inbox page counts unread agent messages per channel; a partial
+    # index keeps that an index-only scan over the few unread rows. Built
+    # without holding a write lock.
+    create_index_concurrently(
+        "idx_messages_player_unread",
+        "ON messages (player_id, channel) WHERE read_at IS NULL AND direction = 'outbound'",
+    )
+
+
+def downgrade() -> None:
+    """Drop the unread index."""
+    drop_index_concurrently("idx_messages_player_unread")
@@ -13,11 +13,28 @@ Usage:
 """
 import asyncio
 import os
+import re
 import sys
 
 # Ensure we can import from src
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
 
+# Phrases the first contact must NOT contain, scanned in a single pass
+BAD_PHRASES = re.compile(
+    r"(?P<apology>sorry|apologi[sz]e|apologies)"
+    r"|(?P<mistake>mistake|error)"
+    r"|(?P<wrong_person>wrong\b.*?\bperson|person\b.*?\bwrong)"
+    r"|(?P<not_meant>(?:wasn't|not) meant for you)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+BAD_PHRASE_ISSUES = {
+    "apology": "Contains apology (should NOT apologize)",
+    "mistake": "Mentions mistake/error (should NOT)",
+    "wrong_person": "Mentions wrong person (should NOT)",
+    "not_meant": "Says 'not meant for you' (should NOT)",
+}
+
 
 def test_prompt_only():
     """Test just the prompt generation (no API call)."""
@@ -74,16 +91,10 @@ async def test_full_generation():
     # Analyze response
     print("\n--- ANALYSIS ---")
     issues = []
-    content_lower = response.content.lower()
-
-    if "sorry" in content_lower or "apologize" in content_lower or "apologies" in content_lower:
-        issues.append("Contains apology (should NOT apologize)")
-    if "mistake" in content_lower or "error" in content_lower:
-        issues.append("Mentions mistake/error (should NOT)")
-    if "wrong" in content_lower and "person" in content_lower:
-        issues.append("Mentions wrong person (should NOT)")
-    if "wasn't meant for you" in content_lower or "not meant for you" in content_lower:
-        issues.append("Says 'not meant for you' (should NOT)")
+    for match in BAD_PHRASES.finditer(response.content):
+        issue = BAD_PHRASE_ISSUES[match.lastgroup or ""]
+        if issue not in issues:
+            issues.append(issue)
     if len(response.content) > 200:
         issues.append(f"Too long ({len(response.content)} chars, target: <100)")
 
@@ -1,10 +1,22 @@
 """Base agent abstractions for ARGent AI agents."""
 
+import os
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from uuid import UUID
 
 
+def configure_gemini_api_key(api_key: str) -> None:
+    """Expose the Gemini API key to the Google GenAI SDK.
+
+    ADK builds its GenAI client from the environment, so the key has to be
+    set there. Only write when it changes: agents are constructed per
+    request in some paths, and os.environ writes go through putenv.
+    """
+    if os.environ.get("GOOGLE_API_KEY") != api_key:
+        os.environ["GOOGLE_API_KEY"] = api_key
+
+
 @dataclass
 class AgentContext:
     """Context passed to agents for each invocation."""
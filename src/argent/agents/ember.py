@@ -8,15 +8,21 @@ to delete the cryptic key they received.
 from __future__ import annotations
 
 import logging
-import os
+from collections import OrderedDict
 from typing import TYPE_CHECKING, Any
+from uuid import uuid4
 
 from google.adk import Runner
 from google.adk.agents import LlmAgent
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
-from argent.agents.base import AgentContext, AgentResponse, BaseAgent
+from argent.agents.base import (
+    AgentContext,
+    AgentResponse,
+    BaseAgent,
+    configure_gemini_api_key,
+)
 from argent.config import get_settings
 from argent.story import PromptBuilder, load_character
 
@@ -25,6 +31,31 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+SUBJECT_PREFIX = "subject:"
+
+# Persona and prompt builder are immutable, so every instance shares them
+_EMBER_PERSONA = load_character("ember")
+_PROMPT_BUILDER = PromptBuilder()
+
+
+def _split_subject(response_text: str) -> tuple[str | None, str]:
+    """Split an optional "Subject: ..." first line off a response.
+
+    Only the prefix is lowercased for the comparison, so long first lines
+    are never copied just to check it.
+
+    Returns:
+        Tuple of (subject or None, remaining content)
+    """
+    prefix_len = len(SUBJECT_PREFIX)
+    if response_text[:prefix_len].lower() != SUBJECT_PREFIX:
+        return None, response_text
+
+    newline = response_text.find("\n")
+    if newline == -1:
+        return response_text[prefix_len:].strip(), ""
+    return response_text[prefix_len:newline].strip(), response_text[newline + 1 :].strip()
+
 
 class EmberAgent(BaseAgent):
     """Ember - the anxious whistleblower agent.
@@ -36,6 +67,12 @@ class EmberAgent(BaseAgent):
 
     APP_NAME = "argent"
 
+    # Max number of built system prompts kept per agent instance
+    PROMPT_CACHE_SIZE = 256
+
+    # Max number of player conversations with a live ADK session
+    MAX_PLAYER_SESSIONS = 10_000
+
     def __init__(
         self,
         gemini_api_key: str,
@@ -49,20 +86,24 @@ class EmberAgent(BaseAgent):
         """
         self._model = model
 
-        # Load persona from single source of truth
-        self._persona = load_character("ember")
-        self._prompt_builder = PromptBuilder()
+        # Persona from single source of truth (loaded once at import)
+        self._persona = _EMBER_PERSONA
+        self._prompt_builder = _PROMPT_BUILDER
 
-        # Set the API key in environment for Google GenAI SDK
-        os.environ["GOOGLE_API_KEY"] = gemini_api_key
+        # Make the API key available to the Google GenAI SDK
+        configure_gemini_api_key(gemini_api_key)
 
         # Initialize session service for conversation state
         # ADK's InMemorySessionService may not have type stubs in some versions
         session_service: Any = InMemorySessionService
         self._session_service = session_service()
 
-        # Map player sessions to ADK session IDs
-        self._player_sessions: dict[str, str] = {}
+        # Map player sessions to ADK session IDs (least recently used first)
+        self._player_sessions: OrderedDict[str, str] = OrderedDict()
+
+        # ADK agents (and their runners) for built system prompts, keyed on
+        # the prompt inputs
+        self._prompt_cache: dict[tuple, tuple[LlmAgent, Runner]] = {}
 
     @property
     def agent_id(self) -> str:
@@ -104,16 +145,36 @@ class EmberAgent(BaseAgent):
         """
         key = f"{player_id}:{session_id}"
 
-        if key not in self._player_sessions:
-            session = await self._session_service.create_session(
-                app_name=self.APP_NAME,
-                user_id=str(player_id),
-                session_id=session_id,
-            )
-            self._player_sessions[key] = session.id
+        adk_session_id = self._player_sessions.get(key)
+        if adk_session_id is not None:
+            self._player_sessions.move_to_end(key)
+            return adk_session_id
+
+        session = await self._session_service.create_session(
+            app_name=self.APP_NAME,
+            user_id=str(player_id),
+            session_id=session_id,
+        )
+        self._player_sessions[key] = session.id
+
+        if len(self._player_sessions) > self.MAX_PLAYER_SESSIONS:
+            await self._evict_oldest_session()
 
         return self._player_sessions[key]
 
+    async def _evict_oldest_session(self) -> None:
+        """Drop the least recently used player session and its ADK session."""
+        key, adk_session_id = self._player_sessions.popitem(last=False)
+        user_id = key.split(":", 1)[0]
+        try:
+            await self._session_service.delete_session(
+                app_name=self.APP_NAME,
+                user_id=user_id,
+                session_id=adk_session_id,
+            )
+        except Exception as e:
+            logger.warning("Failed to delete evicted ADK session %s: %s", adk_session_id, e)
+
     async def generate_response(
         self, context: AgentContext, player_key: str | None = None
     ) -> AgentResponse:
@@ -126,27 +187,41 @@ class EmberAgent(BaseAgent):
         Returns:
             AgentResponse containing Ember's reply
         """
-        # Build the dynamic system prompt with current context
+        # Build the dynamic system prompt with current context.
+        # The prompt only depends on these inputs (history by length), so
+        # repeat turns reuse the prompt's ADK agent and runner.
         settings = get_settings()
-        system_prompt = self._prompt_builder.build_system_prompt(
-            persona=self._persona,
-            trust_score=context.player_trust_score,
-            player_knowledge=context.player_knowledge,
-            conversation_history=context.conversation_history,
-            player_key=player_key,
-            communication_mode=context.communication_mode,
-            base_url=settings.base_url,
-        )
-
-        # Create a fresh agent with the current system prompt
-        adk_agent = self._create_adk_agent(system_prompt)
-
-        # Create runner for this agent
-        runner = Runner(
-            agent=adk_agent,
-            app_name=self.APP_NAME,
-            session_service=self._session_service,
+        cache_key = (
+            context.player_trust_score,
+            tuple(context.player_knowledge),
+            len(context.conversation_history),
+            player_key,
+            context.communication_mode,
+            settings.base_url,
         )
+        cached = self._prompt_cache.get(cache_key)
+        if cached is None:
+            system_prompt = self._prompt_builder.build_system_prompt(
+                persona=self._persona,
+                trust_score=context.player_trust_score,
+                player_knowledge=context.player_knowledge,
+                conversation_history=context.conversation_history,
+                player_key=player_key,
+                communication_mode=context.communication_mode,
+                base_url=settings.base_url,
+            )
+            adk_agent = self._create_adk_agent(system_prompt)
+            runner = Runner(
+                agent=adk_agent,
+                app_name=self.APP_NAME,
+                session_service=self._session_service,
+            )
+            cached = (adk_agent, runner)
+            if len(self._prompt_cache) >= self.PROMPT_CACHE_SIZE:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._prompt_cache.pop(next(iter(self._prompt_cache)))
+            self._prompt_cache[cache_key] = cached
+        _, runner = cached
 
         # Get or create session for this player/conversation
         adk_session_id = await self._get_or_create_session(
@@ -161,7 +236,7 @@ class EmberAgent(BaseAgent):
         )
 
         # Generate response
-        response_text = ""
+        chunks: list[str] = []
         async for event in runner.run_async(
             user_id=str(context.player_id),
             session_id=adk_session_id,
@@ -170,19 +245,16 @@ class EmberAgent(BaseAgent):
             if event.content and event.content.parts:
                 for part in event.content.parts:
                     if hasattr(part, "text") and part.text:
-                        response_text += part.text
+                        chunks.append(part.text)
+            # Stop once the reply is complete; later events carry nothing we use
+            if event.is_final_response():
+                break
 
         # Clean up the response
-        response_text = response_text.strip()
+        response_text = "".join(chunks).strip()
 
         # Extract subject line if present (format: "Subject: ..." on first line)
-        subject = None
-        content = response_text
-
-        lines = response_text.split("\n", 1)
-        if lines and lines[0].lower().startswith("subject:"):
-            subject = lines[0][8:].strip()
-            content = lines[1].strip() if len(lines) > 1 else ""
+        subject, content = _split_subject(response_text)
 
         logger.debug(
             "Response generated: subject=%r, content_length=%d",
@@ -226,11 +298,12 @@ class EmberAgent(BaseAgent):
             session_service=self._session_service,
         )
 
-        # Create a temporary session for generation
+        # Create a temporary session for generation (unique per call so
+        # concurrent onboardings never share history)
         temp_session = await self._session_service.create_session(
             app_name=self.APP_NAME,
             user_id="system",
-            session_id="first-contact-generation",
+            session_id=f"first-contact-{uuid4()}",
         )
 
         # Trigger generation with a simple prompt
@@ -243,28 +316,31 @@ class EmberAgent(BaseAgent):
             ],
         )
 
-        # Generate response
-        response_text = ""
-        async for event in runner.run_async(
-            user_id="system",
-            session_id=temp_session.id,
-            new_message=message,
-        ):
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if hasattr(part, "text") and part.text:
-                        response_text += part.text
+        # Generate response, then drop the temporary session
+        chunks: list[str] = []
+        try:
+            async for event in runner.run_async(
+                user_id="system",
+                session_id=temp_session.id,
+                new_message=message,
+            ):
+                if event.content and event.content.parts:
+                    for part in event.content.parts:
+                        if hasattr(part, "text") and part.text:
+                            chunks.append(part.text)
+                if event.is_final_response():
+                    break
+        finally:
+            await self._session_service.delete_session(
+                app_name=self.APP_NAME,
+                user_id="system",
+                session_id=temp_session.id,
+            )
 
-        response_text = response_text.strip()
+        response_text = "".join(chunks).strip()
 
         # Try to extract subject line if present (format: "Subject: ..." on first line)
-        subject = None
-        content = response_text
-
-        lines = response_text.split("\n", 1)
-        if lines and lines[0].lower().startswith("subject:"):
-            subject = lines[0][8:].strip()  # Remove "Subject:" prefix
-            content = lines[1].strip() if len(lines) > 1 else ""
+        subject, content = _split_subject(response_text)
 
         # Use cryptic fallback if no subject extracted
         if not subject:
@@ -6,24 +6,71 @@ offering to help the player understand what they have.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import os
-from typing import TYPE_CHECKING, Any
+import re
+import time
+from bisect import bisect_right
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, ClassVar
+from uuid import uuid4
+from weakref import WeakValueDictionary
 
 from google.adk import Runner
 from google.adk.agents import LlmAgent
+from google.adk.agents.context_cache_config import ContextCacheConfig
+from google.adk.agents.readonly_context import ReadonlyContext
+from google.adk.apps import App
+from google.adk.events import Event
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 
-from argent.agents.base import AgentContext, AgentResponse, BaseAgent
+from argent.agents.base import (
+    AgentContext,
+    AgentResponse,
+    BaseAgent,
+    configure_gemini_api_key,
+)
+from argent.agents.response_cache import ResponseCache
 from argent.config import get_settings
 from argent.story import PromptBuilder, load_character
+from argent.story.prompt_builder import TRUST_THRESHOLDS
 
 if TYPE_CHECKING:
     pass
 
 logger = logging.getLogger(__name__)
 
+# Gemini context cache for Miro's static persona prompt (the agent's static
+# instruction). Per-turn context comes from an instruction provider, which
+# ADK adds to each request after the cached prefix and never stores in the
+# session.
+CONTEXT_CACHE_CONFIG = ContextCacheConfig(ttl_seconds=300)
+
+CONTEXT_PART_HEADER = "[CONTEXT - system note, not written by the player]"
+
+# Anything in a player message that could pass for the context header
+_CONTEXT_MARKER_RE = re.compile(r"\[\s*CONTEXT", re.IGNORECASE)
+
+# Dynamic context of the turn being generated. Set by the task running the
+# turn (ADK copies it into any tasks it starts), read by the instruction
+# provider; every turn sets it before running, so no reset is needed.
+_turn_context: ContextVar[str] = ContextVar("miro_turn_context", default="")
+
+
+def _dynamic_instruction(ctx: ReadonlyContext) -> str:
+    """Instruction provider: the per-turn context for the running turn."""
+    return _turn_context.get()
+
+
+# Fixed user turn that triggers first contact generation (built once)
+FIRST_CONTACT_TRIGGER = types.Content(
+    role="user",
+    parts=[types.Part(text="Write the initial SMS message now. Keep it short and intriguing.")],
+)
+
 
 class MiroAgent(BaseAgent):
     """Miro - the calm information broker agent.
@@ -35,6 +82,31 @@ class MiroAgent(BaseAgent):
 
     APP_NAME = "argent"
 
+    # Max number of player conversations with a live ADK session
+    MAX_PLAYER_SESSIONS = 10_000
+
+    # Idle time after which a conversation's ADK session is recreated
+    SESSION_TTL_SECONDS = 3600
+
+    # Small-talk replies are only reused while the prompt context is generic:
+    # early in the conversation, nothing revealed, below portal/hint trust
+    SMALL_TALK_MAX_HISTORY = 2
+    SMALL_TALK_MAX_TRUST = 20
+    SMALL_TALK_MAX_WORDS = 8
+
+    # Number of first contact messages generated ahead of demand, how many
+    # are generated at once while refilling, and how often the pool is
+    # checked by the refill loop
+    FIRST_CONTACT_POOL_SIZE = 5
+    FIRST_CONTACT_REFILL_CONCURRENCY = 2
+    FIRST_CONTACT_REFILL_SECONDS = 60.0
+
+    # First contact has no per-player state, so pre-generated messages are
+    # shared by every instance in the process. A deque (not asyncio.Queue)
+    # because callers run on different event loops (scheduler, API). Only a
+    # long-lived loop fills it (see keep_first_contact_pool_full).
+    _first_contact_pool: ClassVar[deque[str]] = deque(maxlen=FIRST_CONTACT_POOL_SIZE)
+
     def __init__(
         self,
         gemini_api_key: str,
@@ -52,16 +124,57 @@ class MiroAgent(BaseAgent):
         self._persona = load_character("miro")
         self._prompt_builder = PromptBuilder()
 
-        # Set the API key in environment for Google GenAI SDK
-        os.environ["GOOGLE_API_KEY"] = gemini_api_key
+        # Persona-only prompt, identical on every turn (cached by Gemini)
+        self._static_prompt = self._prompt_builder.build_static_prefix(self._persona)
+
+        # Make the API key available to the Google GenAI SDK
+        configure_gemini_api_key(gemini_api_key)
 
         # Initialize session service for conversation state
         # ADK's InMemorySessionService may not have type stubs in some versions
         session_service: Any = InMemorySessionService
         self._session_service = session_service()
 
-        # Map player sessions to ADK session IDs
-        self._player_sessions: dict[str, str] = {}
+        # Map player sessions to (ADK session ID, last used), least recently
+        # used first
+        self._player_sessions: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+        # Per-conversation locks so concurrent turns create one ADK session
+        self._session_locks: WeakValueDictionary[str, asyncio.Lock] = WeakValueDictionary()
+
+        # Replies to common opening messages, reused across players
+        self._response_cache = ResponseCache()
+
+        # One agent and runner for all turns: the static instruction never
+        # changes, per-turn context comes from the instruction provider
+        self._adk_agent = LlmAgent(
+            name="miro",
+            model=self._model,
+            static_instruction=self._static_prompt,
+            instruction=_dynamic_instruction,
+            description="Miro - a calm information broker offering help",
+        )
+        self._runner = Runner(
+            app=App(
+                name=self.APP_NAME,
+                root_agent=self._adk_agent,
+                context_cache_config=CONTEXT_CACHE_CONFIG,
+            ),
+            session_service=self._session_service,
+        )
+
+        # First contact has no per-player state, so its agent is built once too
+        self._first_contact_agent = self._create_adk_agent(
+            self._prompt_builder.build_first_contact_prompt(
+                persona=self._persona,
+                key="",  # Miro doesn't send a key
+            )
+        )
+        self._first_contact_runner = Runner(
+            agent=self._first_contact_agent,
+            app_name=self.APP_NAME,
+            session_service=self._session_service,
+        )
 
     @property
     def agent_id(self) -> str:
@@ -103,32 +216,83 @@ class MiroAgent(BaseAgent):
         """
         key = f"{player_id}:{session_id}"
 
-        if key not in self._player_sessions:
+        adk_session_id = self._lookup_session(key)
+        if adk_session_id is not None:
+            return adk_session_id
+
+        lock = self._session_locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Another turn may have created it while we waited
+            adk_session_id = self._lookup_session(key)
+            if adk_session_id is not None:
+                return adk_session_id
+
+            expired = self._player_sessions.pop(key, None)
+            if expired is not None:
+                await self._delete_session(key, expired[0])
+
             session = await self._session_service.create_session(
                 app_name=self.APP_NAME,
                 user_id=str(player_id),
                 session_id=session_id,
             )
-            self._player_sessions[key] = session.id
+            adk_session_id = str(session.id)
+            self._player_sessions[key] = (adk_session_id, time.monotonic())
 
-        return self._player_sessions[key]
+        while len(self._player_sessions) > self.MAX_PLAYER_SESSIONS:
+            oldest_key, (oldest_id, _) = self._player_sessions.popitem(last=False)
+            await self._delete_session(oldest_key, oldest_id)
 
-    async def generate_response(
-        self, context: AgentContext, player_key: str | None = None
-    ) -> AgentResponse:
-        """Generate Miro's response to a player message.
+        return adk_session_id
+
+    def _lookup_session(self, key: str) -> str | None:
+        """Return the live ADK session ID for a conversation, refreshing it.
+
+        Returns:
+            The ADK session ID, or None if missing or idle past the TTL
+        """
+        entry = self._player_sessions.get(key)
+        if entry is None:
+            return None
+
+        adk_session_id, last_used = entry
+        now = time.monotonic()
+        if now - last_used > self.SESSION_TTL_SECONDS:
+            return None
+
+        self._player_sessions[key] = (adk_session_id, now)
+        self._player_sessions.move_to_end(key)
+        return adk_session_id
+
+    async def _delete_session(self, key: str, adk_session_id: str) -> None:
+        """Delete an evicted or expired ADK session."""
+        user_id = key.split(":", 1)[0]
+        try:
+            await self._session_service.delete_session(
+                app_name=self.APP_NAME,
+                user_id=user_id,
+                session_id=adk_session_id,
+            )
+        except Exception as e:
+            logger.warning("Failed to delete evicted ADK session %s: %s", adk_session_id, e)
+
+    async def _prepare_turn(
+        self, context: AgentContext, player_key: str | None
+    ) -> tuple[str, types.Content, str]:
+        """Get the conversation's ADK session and build the player's turn.
 
         Args:
             context: The context for this interaction
-            player_key: Unused by Miro (included for interface compatibility)
+            player_key: The player's key (for portal URL context)
 
         Returns:
-            AgentResponse containing Miro's reply
+            Tuple of (ADK session ID, user message content, dynamic context)
         """
-        # Build the dynamic system prompt with current context
+        # Build the per-turn context; the static persona prompt is the
+        # agent's static instruction and is served from the Gemini context cache
         # player_key is used for portal URL context (not betrayal like Ember)
         settings = get_settings()
-        system_prompt = self._prompt_builder.build_system_prompt(
+        dynamic_context = self._prompt_builder.build_dynamic_suffix(
             persona=self._persona,
             trust_score=context.player_trust_score,
             player_knowledge=context.player_knowledge,
@@ -138,31 +302,77 @@ class MiroAgent(BaseAgent):
             base_url=settings.base_url,
         )
 
-        # Create a fresh agent with the current system prompt
-        adk_agent = self._create_adk_agent(system_prompt)
-
-        # Create runner for this agent
-        runner = Runner(
-            agent=adk_agent,
-            app_name=self.APP_NAME,
-            session_service=self._session_service,
-        )
-
         # Get or create session for this player/conversation
         adk_session_id = await self._get_or_create_session(
             str(context.player_id),
             context.session_id,
         )
 
-        # Format the player's message
+        # The player's message alone, so it cannot pass for the context
         message = types.Content(
             role="user",
-            parts=[types.Part(text=context.player_message)],
+            parts=[types.Part(text=_CONTEXT_MARKER_RE.sub("(CONTEXT", context.player_message))],
         )
+        return adk_session_id, message, f"{CONTEXT_PART_HEADER}\n{dynamic_context}"
+
+    def _small_talk_key(self, context: AgentContext) -> tuple[int, int] | None:
+        """Get the response cache context for a turn, if it is cacheable.
+
+        Returns:
+            (trust band, history length), or None if the reply depends on
+            more than the message itself
+        """
+        if (
+            len(context.conversation_history) > self.SMALL_TALK_MAX_HISTORY
+            or context.player_knowledge
+            or context.player_trust_score >= self.SMALL_TALK_MAX_TRUST
+            or len(context.player_message.split()) > self.SMALL_TALK_MAX_WORDS
+        ):
+            return None
+        trust_band = bisect_right(TRUST_THRESHOLDS, context.player_trust_score)
+        return trust_band, len(context.conversation_history)
+
+    async def _record_cached_turn(
+        self, context: AgentContext, player_key: str | None, reply: str
+    ) -> None:
+        """Append a turn answered from the cache to the ADK session history.
 
-        # Generate response
-        response_text = ""
-        async for event in runner.run_async(
+        Keeps later model turns aware of the exchange as if it were generated.
+        """
+        adk_session_id, message, _ = await self._prepare_turn(context, player_key)
+        session = await self._session_service.get_session(
+            app_name=self.APP_NAME,
+            user_id=str(context.player_id),
+            session_id=adk_session_id,
+        )
+        if session is None:
+            return
+
+        await self._session_service.append_event(session, Event(author="user", content=message))
+        await self._session_service.append_event(
+            session,
+            Event(
+                author=self._adk_agent.name,
+                content=types.Content(role="model", parts=[types.Part(text=reply)]),
+            ),
+        )
+
+    async def stream_response(
+        self, context: AgentContext, player_key: str | None = None
+    ) -> AsyncIterator[str]:
+        """Stream Miro's reply to a player message as text chunks.
+
+        Args:
+            context: The context for this interaction
+            player_key: The player's key (for portal URL context)
+
+        Yields:
+            Reply text chunks in generation order (not stripped)
+        """
+        adk_session_id, message, dynamic_context = await self._prepare_turn(context, player_key)
+        _turn_context.set(dynamic_context)
+
+        async for event in self._runner.run_async(
             user_id=str(context.player_id),
             session_id=adk_session_id,
             new_message=message,
@@ -170,10 +380,44 @@ class MiroAgent(BaseAgent):
             if event.content and event.content.parts:
                 for part in event.content.parts:
                     if hasattr(part, "text") and part.text:
-                        response_text += part.text
+                        yield part.text
+            if event.is_final_response():
+                break
+
+    async def generate_response(
+        self, context: AgentContext, player_key: str | None = None
+    ) -> AgentResponse:
+        """Generate Miro's response to a player message.
+
+        Args:
+            context: The context for this interaction
+            player_key: The player's key (for portal URL context)
+
+        Returns:
+            AgentResponse containing Miro's reply
+        """
+        # Common openers are answered from the cache when the context allows
+        small_talk_key = self._small_talk_key(context)
+        if small_talk_key is not None:
+            cached = self._response_cache.get(small_talk_key, context.player_message)
+            if cached is not None:
+                await self._record_cached_turn(context, player_key, cached)
+                logger.debug("Miro response served from small-talk cache")
+                return AgentResponse(
+                    content=cached,
+                    subject=None,  # SMS has no subject
+                    trust_delta=0,
+                    new_knowledge=[],
+                )
+
+        chunks = [chunk async for chunk in self.stream_response(context, player_key)]
 
         # Clean up the response - SMS has no subject lines
-        response_text = response_text.strip()
+        response_text = "".join(chunks).strip()
+
+        # Replies carry no trust change yet, so every cacheable one is reusable
+        if small_talk_key is not None and response_text:
+            self._response_cache.put(small_talk_key, context.player_message, response_text)
 
         logger.debug(
             "Miro response generated: content_length=%d",
@@ -195,56 +439,24 @@ class MiroAgent(BaseAgent):
         Ember's key. Miro reaches out cold, offering to help them
         understand what they have.
 
+        Served from the pre-generated pool when possible, falling back to
+        live generation. The pool is never refilled from here: scheduler
+        handlers run in a short-lived event loop that would cancel a
+        background refill.
+
         Returns:
             AgentResponse containing the initial SMS message
         """
-        # Build the first contact prompt (no key - Miro doesn't have it)
-        system_prompt = self._prompt_builder.build_first_contact_prompt(
-            persona=self._persona,
-            key="",  # Miro doesn't send a key
-        )
-
-        # Create agent for first contact
-        adk_agent = self._create_adk_agent(system_prompt)
-
-        # Create runner
-        runner = Runner(
-            agent=adk_agent,
-            app_name=self.APP_NAME,
-            session_service=self._session_service,
-        )
-
-        # Create a temporary session for generation
-        temp_session = await self._session_service.create_session(
-            app_name=self.APP_NAME,
-            user_id="system",
-            session_id="miro-first-contact-generation",
-        )
-
-        # Trigger generation with a simple prompt
-        message = types.Content(
-            role="user",
-            parts=[
-                types.Part(text="Write the initial SMS message now. Keep it short and intriguing.")
-            ],
-        )
-
-        # Generate response
-        response_text = ""
-        async for event in runner.run_async(
-            user_id="system",
-            session_id=temp_session.id,
-            new_message=message,
-        ):
-            if event.content and event.content.parts:
-                for part in event.content.parts:
-                    if hasattr(part, "text") and part.text:
-                        response_text += part.text
-
-        response_text = response_text.strip()
+        try:
+            response_text = self._first_contact_pool.popleft()
+            source = "pool"
+        except IndexError:
+            response_text = await self._generate_first_contact_text()
+            source = "live"
 
         logger.info(
-            "Miro first contact generated: content_length=%d",
+            "Miro first contact generated: source=%s, content_length=%d",
+            source,
             len(response_text),
         )
 
@@ -254,3 +466,77 @@ class MiroAgent(BaseAgent):
             trust_delta=0,
             new_knowledge=[],
         )
+
+    async def keep_first_contact_pool_full(self) -> None:
+        """Top up the first contact pool periodically, forever.
+
+        Run as a task on a long-lived event loop (the API's lifespan), so
+        refills are never cancelled halfway by a closing loop.
+        """
+        while True:
+            try:
+                await self.refill_first_contact_pool()
+            except Exception as e:
+                logger.warning("Failed to refill Miro first contact pool: %s", e)
+            await asyncio.sleep(self.FIRST_CONTACT_REFILL_SECONDS)
+
+    async def refill_first_contact_pool(self) -> None:
+        """Generate first contact messages until the pool is full.
+
+        At most FIRST_CONTACT_REFILL_CONCURRENCY generations run at once,
+        and each message is pooled as soon as it completes, so an
+        interrupted refill keeps what it produced.
+        """
+        missing = self.FIRST_CONTACT_POOL_SIZE - len(self._first_contact_pool)
+        if missing <= 0:
+            return
+
+        semaphore = asyncio.Semaphore(self.FIRST_CONTACT_REFILL_CONCURRENCY)
+
+        async def generate() -> str:
+            async with semaphore:
+                return await self._generate_first_contact_text()
+
+        for generation in asyncio.as_completed([generate() for _ in range(missing)]):
+            try:
+                response_text = await generation
+            except Exception as e:
+                logger.warning("Failed to pre-generate Miro first contact: %s", e)
+                continue
+            if response_text:
+                self._first_contact_pool.append(response_text)
+
+    async def _generate_first_contact_text(self) -> str:
+        """Run the first contact agent once.
+
+        Returns:
+            The generated SMS text
+        """
+        # Create a temporary session for generation (unique per call so
+        # concurrent generations never share history)
+        temp_session = await self._session_service.create_session(
+            app_name=self.APP_NAME,
+            user_id="system",
+            session_id=f"miro-first-contact-{uuid4()}",
+        )
+
+        # Generate response, then drop the temporary session
+        chunks: list[str] = []
+        try:
+            async for event in self._first_contact_runner.run_async(
+                user_id="system",
+                session_id=temp_session.id,
+                new_message=FIRST_CONTACT_TRIGGER,
+            ):
+                if event.content and event.content.parts:
+                    for part in event.content.parts:
+                        if hasattr(part, "text") and part.text:
+                            chunks.append(part.text)
+        finally:
+            await self._session_service.delete_session(
+                app_name=self.APP_NAME,
+                user_id="system",
+                session_id=temp_session.id,
+            )
+
+        return "".join(chunks).strip()
@@ -0,0 +1,71 @@
+"""Reply cache for repeated small-talk turns.
+
+Early, low-trust openers ("who are you?", "what do you want?") get
+near-identical replies from an agent across players, so a reply generated
+once can be reused for the same normalized message in the same context.
+"""
+
+import re
+from collections import OrderedDict
+from collections.abc import Hashable
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_message(message: str) -> str:
+    """Normalize a player message for cache lookups.
+
+    Lowercases, drops punctuation and collapses whitespace, so "Who are
+    you?" and "who  are you" share an entry.
+
+    Args:
+        message: The raw player message
+
+    Returns:
+        The normalized message
+    """
+    return _WHITESPACE.sub(" ", _NON_WORD.sub(" ", message.lower())).strip()
+
+
+class ResponseCache:
+    """Bounded LRU cache of agent replies keyed on prompt context and message."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Number of replies kept (least recently used evicted)
+        """
+        self._max_entries = max_entries
+        self._entries: OrderedDict[tuple[Hashable, str], str] = OrderedDict()
+
+    def get(self, context_key: Hashable, message: str) -> str | None:
+        """Get the cached reply for a message, if any.
+
+        Args:
+            context_key: Everything else the reply depends on (agent, trust band...)
+            message: The raw player message
+
+        Returns:
+            The cached reply, or None on a miss
+        """
+        key = (context_key, normalize_message(message))
+        reply = self._entries.get(key)
+        if reply is not None:
+            self._entries.move_to_end(key)
+        return reply
+
+    def put(self, context_key: Hashable, message: str, reply: str) -> None:
+        """Cache a reply for a message.
+
+        Args:
+            context_key: Everything else the reply depends on (agent, trust band...)
+            message: The raw player message
+            reply: The agent's reply
+        """
+        key = (context_key, normalize_message(message))
+        self._entries[key] = reply
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -5,13 +5,12 @@ using their cryptic key. The URL IS the key: /access/<key>
 """
 
 import logging
-from pathlib import Path
 
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argent.api.templating import TEMPLATES_AUTO_RELOAD, create_templates
 from argent.database import get_db
 from argent.services import evidence
 
@@ -19,9 +18,38 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["evidence"])
 
-# Templates directory
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR), auto_reload=True)
+templates = create_templates()
+
+# The dashboard has a single template; compile it once when not reloading
+_evidence_template = None if TEMPLATES_AUTO_RELOAD else templates.get_template("evidence.html")
+
+
+def _render_evidence(context: dict, status_code: int = 200) -> HTMLResponse:
+    """Render the evidence dashboard template.
+
+    Args:
+        context: Template context (including the request)
+        status_code: HTTP status code for the response
+
+    Returns:
+        Rendered dashboard page
+    """
+    template = _evidence_template or templates.get_template("evidence.html")
+    return HTMLResponse(template.render(context), status_code=status_code)
+
+
+def _render_exhausted(request: Request, key: str) -> HTMLResponse:
+    """Render the access denied page for a key past its access limit."""
+    logger.info("Key access limit exhausted: %.9s...", key)
+    return _render_evidence(
+        {
+            "request": request,
+            "access_granted": False,
+            "error_type": "exhausted",
+            "error_message": "ACCESS DENIED: Credential expired",
+        },
+        status_code=403,
+    )
 
 
 @router.get("/access/{key}", response_class=HTMLResponse)
@@ -48,9 +76,8 @@ async def access_evidence(
 
     if player_key is None:
         # Invalid key - log attempt and show error
-        logger.warning("Invalid key access attempt: %s", key[:9] + "..." if len(key) > 9 else key)
-        return templates.TemplateResponse(
-            "evidence.html",
+        logger.warning("Invalid key access attempt: %.9s%s", key, "..." if len(key) > 9 else "")
+        return _render_evidence(
             {
                 "request": request,
                 "access_granted": False,
@@ -60,28 +87,16 @@ async def access_evidence(
             status_code=403,
         )
 
-    # Check access limit
+    # Check access limit (the increment below re-checks it atomically)
     if not await evidence.check_access_limit(player_key):
         # Limit exhausted - log and show error
-        await evidence.log_access(db, player_key, success=False, request=request)
-        await db.commit()
-
-        logger.info("Key access limit exhausted: %s", key[:9] + "...")
-        return templates.TemplateResponse(
-            "evidence.html",
-            {
-                "request": request,
-                "access_granted": False,
-                "error_type": "exhausted",
-                "error_message": "ACCESS DENIED: Credential expired",
-            },
-            status_code=403,
-        )
+        await evidence.log_access(player_key, success=False, request=request)
+        return _render_exhausted(request, key)
 
-    # Valid access - log, increment, record knowledge
-    await evidence.log_access(db, player_key, success=True, request=request)
-    await evidence.increment_access(db, player_key)
-    await evidence.record_dashboard_knowledge(db, player_key.player_id)
+    # Valid access - log (queued), increment and record knowledge (one statement)
+    if not await evidence.record_granted_access(db, player_key, request):
+        # A concurrent request used the last access
+        return _render_exhausted(request, key)
 
     # Get remaining accesses for display
     remaining = await evidence.get_remaining_accesses(player_key)
@@ -96,8 +111,7 @@ async def access_evidence(
 
     # TODO: Emit key_used event for story triggers
 
-    return templates.TemplateResponse(
-        "evidence.html",
+    return _render_evidence(
         {
             "request": request,
             "access_granted": True,
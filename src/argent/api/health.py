@@ -1,6 +1,8 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter, Depends
+import time
+
+from fastapi import APIRouter, Depends, Response
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -8,21 +10,45 @@ from argent.database import get_db
 
 router = APIRouter(tags=["health"])
 
+# Pre-serialized liveness body, shared by every /health response
+_HEALTHY = Response(
+    content=b'{"status":"healthy"}',
+    media_type="application/json",
+    headers={"cache-control": "no-cache"},
+)
+
+# How long a successful database probe is reused by /health/ready
+READINESS_CACHE_SECONDS = 1.0
+
+# Monotonic time of the last successful database probe
+_last_ready_at = float("-inf")
+
 
 @router.get("/health")
-async def health_check() -> dict:
+async def health_check() -> Response:
     """Basic health check endpoint."""
-    return {"status": "healthy"}
+    return _HEALTHY
 
 
 @router.get("/health/ready")
 async def readiness_check(db: AsyncSession = Depends(get_db)) -> dict:
-    """Readiness check that verifies database connectivity."""
-    try:
-        await db.execute(text("SELECT 1"))
+    """Readiness check that verifies database connectivity.
+
+    A successful probe is reused for READINESS_CACHE_SECONDS so frequent
+    load balancer checks don't each take a pooled connection. Failures are
+    not cached, so recovery shows up on the next check.
+    """
+    global _last_ready_at
+
+    if time.monotonic() - _last_ready_at < READINESS_CACHE_SECONDS:
         db_status = "connected"
-    except Exception as e:
-        db_status = f"error: {e}"
+    else:
+        try:
+            await db.execute(text("SELECT 1"))
+            db_status = "connected"
+            _last_ready_at = time.monotonic()
+        except Exception as e:
+            db_status = f"error: {e}"
 
     return {
         "status": "ready" if db_status == "connected" else "not_ready",
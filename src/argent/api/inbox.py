@@ -3,29 +3,49 @@
 Provides:
 - Page routes for inbox UI (HTML)
 - API endpoints for inbox operations (JSON)
+
+All handlers and dependencies here must be ``async def`` and do their
+I/O through the async session. FastAPI runs sync ones on the shared AnyIO
+threadpool, which many polling clients can exhaust.
 """
 
 import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime
-from pathlib import Path
-from typing import TYPE_CHECKING, Annotated
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Annotated, Any, TypeVar
 from uuid import UUID
 
 if TYPE_CHECKING:
     from argent.agents.base import BaseAgent
 
 import asyncio
-import threading
 
-from fastapi import APIRouter, Cookie, Depends, HTTPException, Request, Response, status
-from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi import (
+    APIRouter,
+    Cookie,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from jinja2 import Template
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argent.api.onboarding import SESSION_MAX_AGE, session_serializer
+from argent.api.templating import TEMPLATES_AUTO_RELOAD, create_templates
 from argent.config import Settings, get_settings
-from argent.database import get_db
+from argent.database import async_session_maker, get_db
 from argent.models import Player
 from argent.models.player import Message, PlayerKey, PlayerKnowledge, PlayerTrust
 from argent.services.base import OutboundMessage
@@ -34,11 +54,50 @@ from argent.story import load_character
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class CurrentPlayer:
+    """The logged-in player's columns that inbox routes read."""
+
+    id: UUID
+    communication_mode: str
+
+
+# Logged-in players, so inbox polling skips the lookup: player ID ->
+# (expires at, CurrentPlayer). Plain values rather than Player instances,
+# which a request's rollback would expire for every later cache hit.
+# Neither column changes after registration.
+PLAYER_CACHE_TTL_SECONDS = 30.0
+PLAYER_CACHE_SIZE = 4096
+_player_cache: OrderedDict[UUID, tuple[float, CurrentPlayer]] = OrderedDict()
+
+# JSON routes serialize with orjson; page routes set HTMLResponse themselves
 router = APIRouter(tags=["inbox"])
 
-# Templates directory
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR), auto_reload=True)
+templates = create_templates()
+
+# Conversation IDs of messages without a session: "single-{message_uuid}"
+_SINGLE_MSG_RE = re.compile(
+    r"^single-([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12})$"
+)
+
+# Page templates, compiled once when not reloading
+_PAGE_TEMPLATES = (
+    "hub.html",
+    "inbox.html",
+    "text.html",
+    "text_thread.html",
+    "conversation.html",
+    "compose.html",
+    "thread.html",
+)
+_page_templates: dict[str, Template] = (
+    {}
+    if TEMPLATES_AUTO_RELOAD
+    else {name: templates.get_template(name) for name in _PAGE_TEMPLATES}
+)
 
 
 # --- Pydantic Models ---
@@ -47,7 +106,7 @@ templates = Jinja2Templates(directory=str(TEMPLATES_DIR), auto_reload=True)
 class MessageSummary(BaseModel):
     """Summary of a message for inbox list view."""
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
     id: UUID
     channel: str
@@ -62,7 +121,7 @@ class MessageSummary(BaseModel):
 class MessageDetail(BaseModel):
     """Full message content."""
 
-    model_config = {"from_attributes": True}
+    model_config = ConfigDict(from_attributes=True)
 
     id: UUID
     channel: str
@@ -76,6 +135,10 @@ class MessageDetail(BaseModel):
     session_id: str | None
 
 
+# Validates and serializes whole message lists inside pydantic-core
+_MESSAGE_LIST_ADAPTER = TypeAdapter(list[MessageDetail])
+
+
 class ConversationSummary(BaseModel):
     """Summary of a conversation thread."""
 
@@ -106,6 +169,36 @@ class MarkReadRequest(BaseModel):
 # --- Helper Functions ---
 
 
+def _render_page(name: str, context: dict) -> HTMLResponse:
+    """Render an inbox page template.
+
+    Args:
+        name: Template file name
+        context: Template context (including the request)
+
+    Returns:
+        Rendered page
+    """
+    template = _page_templates.get(name) or templates.get_template(name)
+    return HTMLResponse(template.render(context))
+
+
+@lru_cache(maxsize=8192)
+def _verify_session(session_cookie: str, secret_key: str) -> tuple[str, float] | None:
+    """Verify a session cookie's signature (cached per cookie).
+
+    Returns:
+        The player ID and the time the cookie was signed, or None if invalid
+    """
+    try:
+        player_id, signed_at = session_serializer(secret_key).loads(
+            session_cookie, max_age=SESSION_MAX_AGE, return_timestamp=True
+        )
+    except Exception:
+        return None
+    return str(player_id), signed_at.timestamp()
+
+
 def _get_player_id_from_session(
     session_cookie: str | None,
     settings: Settings,
@@ -113,28 +206,94 @@ def _get_player_id_from_session(
     """Extract player ID from session cookie."""
     if not session_cookie:
         return None
-    try:
-        from itsdangerous import URLSafeTimedSerializer
-
-        serializer = URLSafeTimedSerializer(settings.secret_key, salt="session")
-        result: str = serializer.loads(session_cookie, max_age=60 * 60 * 24 * 7)
-        return result
-    except Exception:
+    verified = _verify_session(session_cookie, settings.secret_key)
+    # The signature check is cached, so re-check the cookie's age here
+    if verified is None or time.time() - verified[1] > SESSION_MAX_AGE:
         return None
+    return verified[0]
 
 
 async def _get_current_player(
     argent_session: str | None,
     db: AsyncSession,
     settings: Settings,
-) -> Player | None:
-    """Get current player from session cookie."""
+) -> CurrentPlayer | None:
+    """Get current player from session cookie.
+
+    Only the columns inbox routes read are loaded. Players are cached for
+    PLAYER_CACHE_TTL_SECONDS.
+    """
     player_id = _get_player_id_from_session(argent_session, settings)
     if not player_id:
         return None
 
-    result = await db.execute(select(Player).where(Player.id == UUID(player_id)))
-    return result.scalar_one_or_none()
+    player_uuid = UUID(player_id)
+    now = time.monotonic()
+    cached = _player_cache.get(player_uuid)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    result = await db.execute(
+        select(Player.id, Player.communication_mode).where(Player.id == player_uuid)
+    )
+    row = result.one_or_none()
+    if row is None:
+        return None
+
+    player = CurrentPlayer(id=row.id, communication_mode=row.communication_mode)
+    _player_cache[player_uuid] = (now + PLAYER_CACHE_TTL_SECONDS, player)
+    _player_cache.move_to_end(player_uuid)
+    if len(_player_cache) > PLAYER_CACHE_SIZE:
+        _player_cache.popitem(last=False)
+
+    return player
+
+
+async def require_web_inbox_player(
+    argent_session: Annotated[str | None, Cookie()] = None,
+    db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings),
+) -> CurrentPlayer:
+    """Dependency: the logged-in player, for web inbox API routes.
+
+    Raises:
+        HTTPException: 404 if the web inbox is disabled, 401 if not logged in
+    """
+    if not settings.web_inbox_enabled:
+        raise HTTPException(status_code=404, detail="Web inbox not enabled")
+
+    player = await _get_current_player(argent_session, db, settings)
+    if not player:
+        raise HTTPException(status_code=401, detail="Not authenticated")
+    return player
+
+
+async def require_web_inbox_page_player(
+    argent_session: Annotated[str | None, Cookie()] = None,
+    db: AsyncSession = Depends(get_db),
+    settings: Settings = Depends(get_settings),
+) -> CurrentPlayer:
+    """Dependency: the logged-in web_only player, for inbox page routes.
+
+    Players who aren't logged in are redirected to registration, and
+    immersive mode players to /start.
+
+    Raises:
+        HTTPException: 404 if the web inbox is disabled, or a 303 redirect
+    """
+    if not settings.web_inbox_enabled:
+        raise HTTPException(status_code=404, detail="Web inbox not enabled")
+
+    player = await _get_current_player(argent_session, db, settings)
+    if not player:
+        raise HTTPException(
+            status_code=status.HTTP_303_SEE_OTHER, headers={"Location": "/register"}
+        )
+
+    # Only web_only mode players can access inbox
+    if player.communication_mode != "web_only":
+        raise HTTPException(status_code=status.HTTP_303_SEE_OTHER, headers={"Location": "/start"})
+    return player
 
 
 def _get_web_inbox_service(db: AsyncSession) -> WebInboxService:
@@ -143,15 +302,24 @@ def _get_web_inbox_service(db: AsyncSession) -> WebInboxService:
 
 
 async def _get_nav_context(db: AsyncSession, player_id: UUID) -> dict:
-    """Get common navigation context for all inbox pages."""
+    """Get common navigation context for all inbox pages.
+
+    Args:
+        db: Database session
+        player_id: The player's ID
+    """
     inbox_service = _get_web_inbox_service(db)
-    email_unread = await inbox_service.get_unread_count(player_id, channel_filter="email")
-    sms_unread = await inbox_service.get_unread_count(player_id, channel_filter="sms")
-    return {"email_unread": email_unread, "sms_unread": sms_unread}
+    unread = await inbox_service.get_unread_counts_by_channel(player_id)
+    return {"email_unread": unread.get("email", 0), "sms_unread": unread.get("sms", 0)}
 
 
+@lru_cache(maxsize=64)
 def _get_agent_avatar_url(agent_id: str | None) -> str | None:
-    """Get the avatar URL for an agent."""
+    """Get the avatar URL for an agent.
+
+    Cached: personas are registered at import, and non-persona senders
+    (e.g. "system") would otherwise raise and catch a ValueError per message.
+    """
     if not agent_id:
         return None
     try:
@@ -163,6 +331,81 @@ def _get_agent_avatar_url(agent_id: str | None) -> str | None:
     return None
 
 
+_MESSAGE_KEYS = (
+    "id",
+    "channel",
+    "direction",
+    "sender_name",
+    "subject",
+    "content",
+    "created_at",
+    "read_at",
+    "session_id",
+)
+_message_values = attrgetter(*_MESSAGE_KEYS)
+_message_values_html = attrgetter(*_MESSAGE_KEYS, "html_content")
+
+
+def _message_detail_response(message: Message) -> Response:
+    """Build a JSON response for one message.
+
+    The model is validated from the ORM row once and dumped by
+    pydantic-core. Returning the model itself would make FastAPI dump it
+    to a dict, validate it again and then encode it.
+    """
+    payload = MessageDetail.model_validate(message).model_dump_json()
+    return Response(content=payload, media_type="application/json")
+
+
+def _message_dicts(messages: Iterable[Message], include_html: bool = False) -> list[dict]:
+    """Build template dicts for messages, with avatar URLs.
+
+    Avatars are resolved once per distinct agent.
+
+    Args:
+        messages: Messages, in display order
+        include_html: Also include each message's html_content
+
+    Returns:
+        One dict per message
+    """
+    keys = (*_MESSAGE_KEYS, "html_content") if include_html else _MESSAGE_KEYS
+    values = _message_values_html if include_html else _message_values
+    avatar_urls: dict[str | None, str | None] = {}
+    rows = []
+    for msg in messages:
+        row = dict(zip(keys, values(msg), strict=True))
+        agent_id = msg.agent_id
+        if agent_id not in avatar_urls:
+            avatar_urls[agent_id] = _get_agent_avatar_url(agent_id)
+        row["avatar_url"] = avatar_urls[agent_id]
+        rows.append(row)
+    return rows
+
+
+# A conversation's agent never changes: (player_id, session_id) -> agent_id
+SESSION_AGENT_CACHE_SIZE = 4096
+_session_agent_cache: OrderedDict[tuple[UUID, str], str] = OrderedDict()
+
+# Built once; each lookup only binds parameters
+_SESSION_AGENT_STMT = (
+    select(Message.agent_id)
+    .where(Message.player_id == bindparam("player_id"))
+    .where(Message.session_id == bindparam("session_id"))
+    .where(Message.agent_id.isnot(None))
+    .limit(1)
+)
+
+
+def _remember_session_agent(player_id: UUID, session_id: str, agent_id: str) -> None:
+    """Cache which agent a conversation session belongs to."""
+    key = (player_id, session_id)
+    _session_agent_cache[key] = agent_id
+    _session_agent_cache.move_to_end(key)
+    if len(_session_agent_cache) > SESSION_AGENT_CACHE_SIZE:
+        _session_agent_cache.popitem(last=False)
+
+
 async def _get_session_agent_id(
     db: AsyncSession,
     player_id: UUID,
@@ -171,16 +414,19 @@ async def _get_session_agent_id(
     """Determine which agent a conversation session belongs to.
 
     Looks at existing messages in the session to find the agent_id
-    from outbound (agent) messages.
+    from outbound (agent) messages. Found agents are cached.
     """
+    cached = _session_agent_cache.get((player_id, session_id))
+    if cached is not None:
+        _session_agent_cache.move_to_end((player_id, session_id))
+        return cached
+
     result = await db.execute(
-        select(Message.agent_id)
-        .where(Message.player_id == player_id)
-        .where(Message.session_id == session_id)
-        .where(Message.agent_id.isnot(None))
-        .limit(1)
+        _SESSION_AGENT_STMT, {"player_id": player_id, "session_id": session_id}
     )
     agent_id = result.scalar_one_or_none()
+    if agent_id is not None:
+        _remember_session_agent(player_id, session_id, agent_id)
     return agent_id
 
 
@@ -207,7 +453,7 @@ async def _get_player_knowledge(
     result = await db.execute(
         select(PlayerKnowledge.fact).where(PlayerKnowledge.player_id == player_id)
     )
-    return [row[0] for row in result.all()]
+    return list(result.scalars())
 
 
 async def _get_conversation_history(
@@ -220,30 +466,88 @@ async def _get_conversation_history(
 
     Returns messages in chronological order (oldest first).
     """
-    result = await db.execute(
-        select(Message)
+    # Newest `limit` messages (only the columns the history uses), then
+    # re-sorted oldest first by the database
+    recent = (
+        select(Message.direction, Message.content, Message.sender_name, Message.created_at)
         .where(Message.player_id == player_id)
         .where(Message.session_id == session_id)
         .order_by(Message.created_at.desc())
         .limit(limit)
+        .subquery()
+    )
+    result = await db.execute(
+        select(recent.c.direction, recent.c.content, recent.c.sender_name).order_by(
+            recent.c.created_at.asc()
+        )
     )
-    messages = list(result.scalars().all())
-
-    # Reverse to get chronological order
-    messages.reverse()
 
     return [
         {
-            "role": "user" if msg.direction == "inbound" else "assistant",
-            "content": msg.content or "",
-            "sender": msg.sender_name,
+            "role": "user" if direction == "inbound" else "assistant",
+            "content": content or "",
+            "sender": sender_name,
         }
-        for msg in messages
+        for direction, content, sender_name in result
     ]
 
 
-# Agent instance cache (simple singleton pattern for MVP)
-_agent_instances: dict = {}
+async def _get_player_key_and_mode(
+    db: AsyncSession,
+    player_id: UUID,
+) -> tuple[str | None, str]:
+    """Get the player's key and communication mode."""
+    result = await db.execute(
+        select(PlayerKey.key_value, Player.communication_mode).where(
+            PlayerKey.player_id == player_id,
+            Player.id == player_id,
+        )
+    )
+    row = result.first()
+    if not row:
+        return None, "immersive"
+    return row[0], row[1]
+
+
+async def _get_trust_and_history(
+    db: AsyncSession,
+    player_id: UUID,
+    agent_id: str,
+    session_id: str,
+) -> tuple[int, list[dict]]:
+    """Get the agent's trust score and the conversation history (two reads)."""
+    trust_score = await _get_player_trust_score(db, player_id, agent_id)
+    history = await _get_conversation_history(db, player_id, session_id)
+    return trust_score, history
+
+
+async def _get_player_key_mode_and_knowledge(
+    db: AsyncSession,
+    player_id: UUID,
+) -> tuple[str | None, str, list[str]]:
+    """Get the player's key, communication mode and learned facts (two reads)."""
+    player_key, communication_mode = await _get_player_key_and_mode(db, player_id)
+    knowledge = await _get_player_knowledge(db, player_id)
+    return player_key, communication_mode, knowledge
+
+
+async def _in_own_session(query: Callable[..., Awaitable[T]], *args: Any) -> T:
+    """Run a query helper in its own short-lived session.
+
+    An AsyncSession runs one statement at a time, so concurrent queries
+    each need a session (and connection) of their own.
+    """
+    async with async_session_maker() as session:
+        return await query(session, *args)
+
+
+# Agent instance cache (simple singleton pattern for MVP); the lock keeps
+# threads racing on a cold agent from each building one
+_agent_instances: dict[str, "BaseAgent"] = {}
+_agent_lock = threading.Lock()
+
+# Agents the web inbox replies as
+_INBOX_AGENT_IDS = ("ember", "miro")
 
 
 def _get_agent(agent_id: str, settings: Settings) -> "BaseAgent | None":
@@ -254,46 +558,85 @@ def _get_agent(agent_id: str, settings: Settings) -> "BaseAgent | None":
     if not settings.gemini_api_key:
         return None
 
-    if agent_id not in _agent_instances:
-        if agent_id == "ember":
-            from argent.agents.ember import EmberAgent
+    agent = _agent_instances.get(agent_id)
+    if agent is not None:
+        return agent
 
-            _agent_instances[agent_id] = EmberAgent(
-                gemini_api_key=settings.gemini_api_key,
-                model=settings.gemini_model,
-            )
-        elif agent_id == "miro":
-            from argent.agents.miro import MiroAgent
+    with _agent_lock:
+        if agent_id not in _agent_instances:
+            if agent_id == "ember":
+                from argent.agents.ember import EmberAgent
 
-            _agent_instances[agent_id] = MiroAgent(
-                gemini_api_key=settings.gemini_api_key,
-                model=settings.gemini_model,
-            )
+                _agent_instances[agent_id] = EmberAgent(
+                    gemini_api_key=settings.gemini_api_key,
+                    model=settings.gemini_model,
+                )
+            elif agent_id == "miro":
+                from argent.agents.miro import MiroAgent
+
+                _agent_instances[agent_id] = MiroAgent(
+                    gemini_api_key=settings.gemini_api_key,
+                    model=settings.gemini_model,
+                )
 
     return _agent_instances.get(agent_id)
 
 
+def warm_agents(settings: Settings) -> None:
+    """Build the inbox agents ahead of the first compose.
+
+    Importing the agent modules (and the ADK) and constructing the agents
+    otherwise happens on the first reply.
+
+    Args:
+        settings: Application settings
+    """
+    if not settings.web_inbox_enabled:
+        return
+    for agent_id in _INBOX_AGENT_IDS:
+        try:
+            _get_agent(agent_id, settings)
+        except Exception as e:
+            # Retried on the first reply, as before
+            logger.error("Failed to warm agent %s: %s", agent_id, e)
+
+
+def start_first_contact_refill(settings: Settings) -> "asyncio.Task[None] | None":
+    """Keep Miro's first contact pool topped up from the running loop.
+
+    Call from the app lifespan and cancel the task on shutdown. Scheduler
+    handlers only consume the pool; their event loops are too short-lived
+    to refill it.
+
+    Args:
+        settings: Application settings
+
+    Returns:
+        The refill task, or None when agent replies are disabled
+    """
+    if not settings.agent_response_enabled:
+        return None
+    agent = _get_agent("miro", settings)
+    if agent is None:
+        return None
+
+    from argent.agents.miro import MiroAgent
+
+    if not isinstance(agent, MiroAgent):
+        return None
+    return asyncio.create_task(agent.keep_first_contact_pool_full())
+
+
 # --- Page Routes ---
 
 
 @router.get("/hub", response_class=HTMLResponse)
 async def hub_page(
     request: Request,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_page_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Response:
     """Hub page - player statistics dashboard."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        return RedirectResponse(url="/register", status_code=status.HTTP_303_SEE_OTHER)
-
-    if player.communication_mode != "web_only":
-        return RedirectResponse(url="/start", status_code=status.HTTP_303_SEE_OTHER)
-
     # Get dashboard statistics
     from argent.services.dashboard import get_dashboard_stats
 
@@ -302,7 +645,7 @@ async def hub_page(
     # Get nav context for bottom navigation
     nav_context = await _get_nav_context(db, player.id)
 
-    return templates.TemplateResponse(
+    return _render_page(
         "hub.html",
         {
             "request": request,
@@ -317,51 +660,23 @@ async def hub_page(
 @router.get("/inbox", response_class=HTMLResponse)
 async def inbox_page(
     request: Request,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_page_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Response:
     """Email inbox page - shows only email messages."""
-    # Check if web inbox is enabled
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    # Get current player
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        return RedirectResponse(url="/register", status_code=status.HTTP_303_SEE_OTHER)
-
-    # Only web_only mode players can access inbox
-    if player.communication_mode != "web_only":
-        # Redirect immersive mode players away
-        return RedirectResponse(url="/start", status_code=status.HTTP_303_SEE_OTHER)
-
-    # Get email messages only
+    # Get email messages only, and the nav context for bottom navigation
+    # (includes the email unread count) concurrently on a second session
     inbox_service = _get_web_inbox_service(db)
-    messages = await inbox_service.get_messages(player.id, channel_filter="email", limit=50)
-    unread_count = await inbox_service.get_unread_count(player.id, channel_filter="email")
-
-    # Get nav context for bottom navigation
-    nav_context = await _get_nav_context(db, player.id)
+    messages, nav_context = await asyncio.gather(
+        inbox_service.get_messages(player.id, channel_filter="email", limit=50),
+        _in_own_session(_get_nav_context, player.id),
+    )
+    unread_count = nav_context["email_unread"]
 
     # Add avatar URLs to messages
-    messages_with_avatars = [
-        {
-            "id": msg.id,
-            "channel": msg.channel,
-            "direction": msg.direction,
-            "sender_name": msg.sender_name,
-            "subject": msg.subject,
-            "content": msg.content,
-            "created_at": msg.created_at,
-            "read_at": msg.read_at,
-            "session_id": msg.session_id,
-            "avatar_url": _get_agent_avatar_url(msg.agent_id),
-        }
-        for msg in messages
-    ]
+    messages_with_avatars = _message_dicts(messages)
 
-    return templates.TemplateResponse(
+    return _render_page(
         "inbox.html",
         {
             "request": request,
@@ -377,21 +692,10 @@ async def inbox_page(
 @router.get("/text", response_class=HTMLResponse)
 async def text_page(
     request: Request,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_page_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Response:
     """Text/SMS messages page - shows SMS conversations."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        return RedirectResponse(url="/register", status_code=status.HTTP_303_SEE_OTHER)
-
-    if player.communication_mode != "web_only":
-        return RedirectResponse(url="/start", status_code=status.HTTP_303_SEE_OTHER)
-
     # Get SMS conversations (grouped by session)
     inbox_service = _get_web_inbox_service(db)
     conversations = await inbox_service.get_conversations(player.id, channel_filter="sms")
@@ -402,8 +706,6 @@ async def text_page(
     # Add avatar URLs to conversations
     conversations_with_avatars = []
     for conv in conversations:
-        latest_msg = conv.get("latest_message")
-        agent_id = latest_msg.agent_id if latest_msg else None
         conversations_with_avatars.append(
             {
                 "session_id": conv["session_id"],
@@ -411,12 +713,12 @@ async def text_page(
                 "message_count": conv["message_count"],
                 "unread_count": conv["unread_count"],
                 "updated_at": conv["updated_at"],
-                "latest_preview": (latest_msg.content or "")[:80] if latest_msg else "",
-                "avatar_url": _get_agent_avatar_url(agent_id),
+                "latest_preview": conv["preview"][:80],
+                "avatar_url": _get_agent_avatar_url(conv["agent_id"]),
             }
         )
 
-    return templates.TemplateResponse(
+    return _render_page(
         "text.html",
         {
             "request": request,
@@ -432,31 +734,17 @@ async def text_page(
 async def text_thread_page(
     request: Request,
     session_id: str,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_page_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Response:
     """SMS conversation thread view - chat-style interface."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        return RedirectResponse(url="/register", status_code=status.HTTP_303_SEE_OTHER)
-
-    if player.communication_mode != "web_only":
-        return RedirectResponse(url="/start", status_code=status.HTTP_303_SEE_OTHER)
-
     inbox_service = _get_web_inbox_service(db)
-    messages = await inbox_service.get_conversation_messages(player.id, session_id)
+    # Fetching the conversation also marks it read
+    messages = await inbox_service.get_conversation_messages(player.id, session_id, mark_read=True)
 
     if not messages:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    # Mark conversation as read
-    await inbox_service.mark_conversation_read(player.id, session_id)
-    await db.commit()
-
     # Determine conversation title from participants
     participants = {m.sender_name for m in messages if m.sender_name and m.sender_name != "You"}
     title = ", ".join(sorted(participants)) if participants else "Text Message"
@@ -480,7 +768,7 @@ async def text_thread_page(
         for msg in messages
     ]
 
-    return templates.TemplateResponse(
+    return _render_page(
         "text_thread.html",
         {
             "request": request,
@@ -499,73 +787,41 @@ async def text_thread_page(
 async def conversation_page(
     request: Request,
     session_id: str,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_page_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Response:
     """Conversation thread view - shows all messages in a conversation."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        return RedirectResponse(url="/register", status_code=status.HTTP_303_SEE_OTHER)
-
-    if player.communication_mode != "web_only":
-        return RedirectResponse(url="/start", status_code=status.HTTP_303_SEE_OTHER)
-
     inbox_service = _get_web_inbox_service(db)
 
     # Handle single messages (no session_id) - format: "single-{message_uuid}"
-    if session_id.startswith("single-"):
-        message_id_str = session_id[7:]  # Remove "single-" prefix
-        try:
-            message_id = UUID(message_id_str)
-            message = await inbox_service.get_message(player.id, message_id)
-            if not message:
-                raise HTTPException(status_code=404, detail="Message not found")
-            messages = [message]
-            # Mark as read
-            await inbox_service.mark_read(player.id, message_id)
-        except ValueError as err:
-            raise HTTPException(status_code=404, detail="Invalid message ID") from err
+    single_match = _SINGLE_MSG_RE.match(session_id)
+    if single_match:
+        message_id = UUID(single_match.group(1))
+        message = await inbox_service.get_message(player.id, message_id, mark_read=True)
+        if not message:
+            raise HTTPException(status_code=404, detail="Message not found")
+        messages = [message]
+        sender = message.sender_name
+        participants = [sender] if sender and sender != "You" else []
     else:
-        # Get messages in conversation
-        messages = await inbox_service.get_conversation_messages(player.id, session_id)
+        # Get messages in conversation, marking them read
+        messages = await inbox_service.get_conversation_messages(
+            player.id, session_id, mark_read=True
+        )
         if not messages:
             raise HTTPException(status_code=404, detail="Conversation not found")
-
-        # Mark conversation as read
-        await inbox_service.mark_conversation_read(player.id, session_id)
-
-    await db.commit()
+        participants = await inbox_service.get_conversation_participants(player.id, session_id)
 
     # Determine conversation title from participants
-    participants = {m.sender_name for m in messages if m.sender_name and m.sender_name != "You"}
-    title = ", ".join(sorted(participants)) if participants else "Conversation"
+    title = ", ".join(participants) if participants else "Conversation"
 
     # Get nav context for bottom navigation
     nav_context = await _get_nav_context(db, player.id)
 
     # Add avatar URLs to messages
-    messages_with_avatars = [
-        {
-            "id": msg.id,
-            "channel": msg.channel,
-            "direction": msg.direction,
-            "sender_name": msg.sender_name,
-            "subject": msg.subject,
-            "content": msg.content,
-            "html_content": msg.html_content,
-            "created_at": msg.created_at,
-            "read_at": msg.read_at,
-            "session_id": msg.session_id,
-            "avatar_url": _get_agent_avatar_url(msg.agent_id),
-        }
-        for msg in messages
-    ]
+    messages_with_avatars = _message_dicts(messages, include_html=True)
 
-    return templates.TemplateResponse(
+    return _render_page(
         "conversation.html",
         {
             "request": request,
@@ -579,44 +835,29 @@ async def conversation_page(
     )
 
 
-def _get_available_contacts() -> list[dict]:
-    """Get list of agents the player can contact."""
-    return [
-        {"id": "ember", "name": "Ember Vance", "channel": "email"},
-        {"id": "miro", "name": "Miro", "channel": "sms"},
-    ]
+# Agents the player can contact
+_AVAILABLE_CONTACTS = (
+    {"id": "ember", "name": "Ember Vance", "channel": "email"},
+    {"id": "miro", "name": "Miro", "channel": "sms"},
+)
 
 
 @router.get("/inbox/compose", response_class=HTMLResponse)
 async def compose_page(
     request: Request,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_page_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Response:
     """Compose new email page."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        return RedirectResponse(url="/register", status_code=status.HTTP_303_SEE_OTHER)
-
-    if player.communication_mode != "web_only":
-        return RedirectResponse(url="/start", status_code=status.HTTP_303_SEE_OTHER)
-
-    # Get available contacts (agents player can email)
-    contacts = _get_available_contacts()
-
     # Get nav context for bottom navigation
     nav_context = await _get_nav_context(db, player.id)
 
-    return templates.TemplateResponse(
+    return _render_page(
         "compose.html",
         {
             "request": request,
             "player": player,
-            "contacts": contacts,
+            "contacts": _AVAILABLE_CONTACTS,
             "active_channel": "email",
             **nav_context,
         },
@@ -627,25 +868,14 @@ async def compose_page(
 async def thread_page(
     request: Request,
     message_id: UUID,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_page_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> Response:
     """Gmail-style thread view - shows all messages in thread with clicked one expanded."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        return RedirectResponse(url="/register", status_code=status.HTTP_303_SEE_OTHER)
-
-    if player.communication_mode != "web_only":
-        return RedirectResponse(url="/start", status_code=status.HTTP_303_SEE_OTHER)
-
     inbox_service = _get_web_inbox_service(db)
 
-    # Get the clicked message
-    message = await inbox_service.get_message(player.id, message_id)
+    # Get the clicked message, marking it read
+    message = await inbox_service.get_message(player.id, message_id, mark_read=True)
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
 
@@ -656,10 +886,6 @@ async def thread_page(
         # Single message, no thread
         messages = [message]
 
-    # Mark the clicked message as read
-    await inbox_service.mark_read(player.id, message_id)
-    await db.commit()
-
     # Determine thread subject from first message with subject
     thread_subject = None
     for msg in messages:
@@ -676,24 +902,9 @@ async def thread_page(
 
     # Add avatar URLs and mark which message is focused
     # Reverse order: newest messages first
-    messages_with_avatars = [
-        {
-            "id": msg.id,
-            "channel": msg.channel,
-            "direction": msg.direction,
-            "sender_name": msg.sender_name,
-            "subject": msg.subject,
-            "content": msg.content,
-            "html_content": msg.html_content,
-            "created_at": msg.created_at,
-            "read_at": msg.read_at,
-            "session_id": msg.session_id,
-            "avatar_url": _get_agent_avatar_url(msg.agent_id),
-        }
-        for msg in reversed(messages)
-    ]
+    messages_with_avatars = _message_dicts(reversed(messages), include_html=True)
 
-    return templates.TemplateResponse(
+    return _render_page(
         "thread.html",
         {
             "request": request,
@@ -712,122 +923,86 @@ async def thread_page(
 # --- API Routes ---
 
 
-@router.get("/api/inbox/conversations")
+@router.get("/api/inbox/conversations", response_model=list[ConversationSummary])
 async def list_conversations(
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
     limit: int = 20,
-) -> list[ConversationSummary]:
-    """List conversation summaries for inbox."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+) -> Response:
+    """List conversation summaries for inbox.
 
+    Rows are built as plain dicts and serialized directly, skipping
+    response model validation; response_model only documents the shape.
+    """
     inbox_service = _get_web_inbox_service(db)
     conversations = await inbox_service.get_conversations(player.id, limit=limit)
 
-    return [
-        ConversationSummary(
-            session_id=str(conv["session_id"]),
-            title=conv["title"],
-            message_count=conv["message_count"],
-            unread_count=conv["unread_count"],
-            updated_at=conv["updated_at"],
-            latest_preview=(conv["latest_message"].content or "")[:100],
-        )
-        for conv in conversations
-    ]
+    return ORJSONResponse(
+        [
+            {
+                "session_id": str(conv["session_id"]),
+                "title": conv["title"],
+                "message_count": conv["message_count"],
+                "unread_count": conv["unread_count"],
+                "updated_at": conv["updated_at"],
+                "latest_preview": conv["preview"],
+            }
+            for conv in conversations
+        ]
+    )
 
 
-@router.get("/api/inbox/conversations/{session_id}/messages")
+@router.get("/api/inbox/conversations/{session_id}/messages", response_model=list[MessageDetail])
 async def get_conversation_messages(
+    request: Request,
     session_id: str,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
-) -> list[MessageDetail]:
-    """Get all messages in a conversation."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        raise HTTPException(status_code=401, detail="Not authenticated")
+) -> Response:
+    """Get all messages in a conversation.
 
+    The list is validated from the ORM rows and dumped to JSON in one pass
+    through pydantic-core, skipping FastAPI's response model handling.
+    Responses carry an ETag; polling clients that send it back get a 304
+    until a message arrives or is read.
+    """
     inbox_service = _get_web_inbox_service(db)
+    version = await inbox_service.get_conversation_version(player.id, session_id)
+    headers = {"ETag": f'"{version}"', "Cache-Control": "no-cache"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
     messages = await inbox_service.get_conversation_messages(player.id, session_id)
 
-    return [
-        MessageDetail(
-            id=msg.id,
-            channel=msg.channel,
-            direction=msg.direction,
-            sender_name=msg.sender_name,
-            subject=msg.subject,
-            content=msg.content,
-            html_content=msg.html_content,
-            created_at=msg.created_at,
-            read_at=msg.read_at,
-            session_id=msg.session_id,
-        )
-        for msg in messages
-    ]
+    payload = _MESSAGE_LIST_ADAPTER.dump_json(
+        _MESSAGE_LIST_ADAPTER.validate_python(messages, from_attributes=True)
+    )
+    return Response(content=payload, media_type="application/json", headers=headers)
 
 
-@router.get("/api/inbox/messages/{message_id}")
+@router.get("/api/inbox/messages/{message_id}", response_model=MessageDetail)
 async def get_message(
     message_id: UUID,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
-) -> MessageDetail:
+) -> Response:
     """Get a single message by ID."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     inbox_service = _get_web_inbox_service(db)
     message = await inbox_service.get_message(player.id, message_id)
 
     if not message:
         raise HTTPException(status_code=404, detail="Message not found")
 
-    return MessageDetail(
-        id=message.id,
-        channel=message.channel,
-        direction=message.direction,
-        sender_name=message.sender_name,
-        subject=message.subject,
-        content=message.content,
-        html_content=message.html_content,
-        created_at=message.created_at,
-        read_at=message.read_at,
-        session_id=message.session_id,
-    )
+    return _message_detail_response(message)
 
 
 @router.post("/api/inbox/messages/{message_id}/read")
 async def mark_message_read(
     message_id: UUID,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> dict[str, bool]:
     """Mark a message as read."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     inbox_service = _get_web_inbox_service(db)
     success = await inbox_service.mark_read(player.id, message_id)
     await db.commit()
@@ -835,24 +1010,30 @@ async def mark_message_read(
     return {"success": success}
 
 
-def _run_agent_response_in_thread(
-    player_id: UUID,
-    session_id: str,
-    agent_id: str,
-    player_message: str,
-    settings: Settings,
-) -> None:
-    """Run agent response generation in a separate thread with its own event loop."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        loop.run_until_complete(
-            _generate_agent_response_background(
-                player_id, session_id, agent_id, player_message, settings
-            )
-        )
-    finally:
-        loop.close()
+# Agent reply tasks in flight (the event loop only keeps weak references)
+_background_tasks: set[asyncio.Task[None]] = set()
+
+# Replies generated at once, so bursts of composes queue here instead of
+# exhausting the pool or Gemini's rate limits. Each reply uses at most two
+# pooled connections while reading its context (none while the model
+# generates); half the pool is left for page requests.
+MAX_CONCURRENT_AGENT_REPLIES = max(
+    1, (get_settings().db_pool_size + get_settings().db_max_overflow) // 4
+)
+_agent_reply_semaphore = asyncio.Semaphore(MAX_CONCURRENT_AGENT_REPLIES)
+
+
+async def drain_agent_replies(timeout: float) -> None:
+    """Wait for in-flight agent replies, e.g. before shutting down.
+
+    Args:
+        timeout: Seconds to wait before giving up on unfinished replies
+    """
+    if not _background_tasks:
+        return
+    _, pending = await asyncio.wait(set(_background_tasks), timeout=timeout)
+    if pending:
+        logger.warning("Shutting down with %d agent replies unfinished", len(pending))
 
 
 async def _generate_agent_response_background(
@@ -864,25 +1045,12 @@ async def _generate_agent_response_background(
 ) -> None:
     """Background task to generate agent response.
 
-    Creates its own database engine and session since we're running in
-    a separate thread with its own event loop.
+    Runs on the app's event loop after the compose request has returned,
+    with its own session from the shared pool, once one of the
+    MAX_CONCURRENT_AGENT_REPLIES slots is free.
     """
-    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-
-    # Create a fresh engine for this event loop
-    bg_engine = create_async_engine(
-        settings.database_url,
-        echo=settings.debug,
-        pool_pre_ping=True,
-    )
-    bg_session_maker = async_sessionmaker(
-        bg_engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
-
     try:
-        async with bg_session_maker() as db:
+        async with _agent_reply_semaphore, async_session_maker() as db:
             agent = _get_agent(agent_id, settings)
             if not agent:
                 logger.warning(
@@ -893,21 +1061,19 @@ async def _generate_agent_response_background(
 
             from argent.agents.base import AgentContext
 
-            # Build agent context
-            trust_score = await _get_player_trust_score(db, player_id, agent_id)
-            player_knowledge_facts = await _get_player_knowledge(db, player_id)
-            history = await _get_conversation_history(db, player_id, session_id)
-
-            # Get player's key and communication mode
-            player_result = await db.execute(
-                select(PlayerKey.key_value, Player.communication_mode).where(
-                    PlayerKey.player_id == player_id,
-                    Player.id == player_id,
-                )
+            # Build agent context: two reads on this session and two on one
+            # more, concurrently (at most two pooled connections per reply)
+            (
+                (trust_score, history),
+                (player_key, communication_mode, player_knowledge_facts),
+            ) = await asyncio.gather(
+                _get_trust_and_history(db, player_id, agent_id, session_id),
+                _in_own_session(_get_player_key_mode_and_knowledge, player_id),
             )
-            row = player_result.first()
-            player_key = row[0] if row else None
-            communication_mode = row[1] if row else "immersive"
+
+            # End the read transaction so the connection goes back to the
+            # pool while the model generates
+            await db.commit()
 
             context = AgentContext(
                 player_id=player_id,
@@ -922,7 +1088,18 @@ async def _generate_agent_response_background(
             # Generate response (pass player_key for Ember's betrayal context)
             response = await agent.generate_response(context, player_key=player_key)
 
-            # Store agent response
+            # Extract trust and knowledge from the exchange
+            from argent.services import classification, trust
+            from argent.services import knowledge as knowledge_service
+
+            extraction = await classification.extract_from_exchange(
+                player_message=player_message,
+                agent_response=response.content,
+                agent_id=agent_id,
+                conversation_context=history,
+            )
+
+            # Store agent response, classification included in the INSERT
             inbox_service = _get_web_inbox_service(db)
             outbound_message = await inbox_service.send_and_store(
                 OutboundMessage(
@@ -934,17 +1111,13 @@ async def _generate_agent_response_background(
                     session_id=session_id,
                 ),
                 display_channel="email" if agent_id == "ember" else "sms",
-            )
-
-            # Extract trust and knowledge from the exchange
-            from argent.services import classification, trust
-            from argent.services import knowledge as knowledge_service
-
-            extraction = await classification.extract_from_exchange(
-                player_message=player_message,
-                agent_response=response.content,
-                agent_id=agent_id,
-                conversation_context=history,
+                classification={
+                    "trust_delta": extraction.trust_delta,
+                    "trust_reason": extraction.trust_reason,
+                    "knowledge": extraction.knowledge_items,
+                    "player_intent": extraction.player_intent,
+                    "confidence": extraction.confidence,
+                },
             )
 
             # Update trust score if there was a change
@@ -955,7 +1128,7 @@ async def _generate_agent_response_background(
                     agent_id=agent_id,
                     delta=extraction.trust_delta,
                     reason=extraction.trust_reason,
-                    message_id=outbound_message.id if outbound_message else None,
+                    message_id=outbound_message.id,
                 )
 
             # Store extracted knowledge
@@ -965,22 +1138,9 @@ async def _generate_agent_response_background(
                     player_id=player_id,
                     facts=extraction.knowledge_items,
                     source_agent=agent_id,
-                    message_id=outbound_message.id if outbound_message else None,
+                    message_id=outbound_message.id,
                 )
 
-            # Store classification on the message
-            if outbound_message:
-                outbound_message.classification = {
-                    "trust_delta": extraction.trust_delta,
-                    "trust_reason": extraction.trust_reason,
-                    "knowledge": extraction.knowledge_items,
-                    "player_intent": extraction.player_intent,
-                    "confidence": extraction.confidence,
-                }
-                from datetime import UTC, datetime
-
-                outbound_message.classified_at = datetime.now(UTC)
-
             await db.commit()
 
             logger.info(
@@ -997,28 +1157,18 @@ async def _generate_agent_response_background(
             str(e),
             exc_info=True,
         )
-    finally:
-        # Clean up the background engine
-        await bg_engine.dispose()
 
 
-@router.post("/api/inbox/compose")
+@router.post("/api/inbox/compose", response_model=MessageDetail)
 async def compose_message(
     request_body: ComposeRequest,
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_player),
     db: AsyncSession = Depends(get_db),
     settings: Settings = Depends(get_settings),
-) -> MessageDetail:
+) -> Response:
     """Compose and send a new message. Agent response is generated in background."""
     from uuid import uuid4
 
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     inbox_service = _get_web_inbox_service(db)
 
     # If no session_id but agent_id provided, this is a NEW conversation
@@ -1028,6 +1178,7 @@ async def compose_message(
     if not session_id and agent_id:
         # Create new session_id for new conversation
         session_id = f"{agent_id}-{uuid4()}"
+        _remember_session_agent(player.id, session_id, agent_id)
         logger.info(
             "Creating new conversation session %s with agent %s",
             session_id,
@@ -1046,22 +1197,22 @@ async def compose_message(
     await db.commit()
 
     # Schedule agent response generation in background using asyncio.create_task
-    # This runs truly in the background without blocking the response
+    # This runs in the background without blocking the response
     if settings.agent_response_enabled and session_id:
         # For replies, look up the agent from existing messages
         if not agent_id:
             agent_id = await _get_session_agent_id(db, player.id, session_id)
 
         if agent_id:
-            # Run in separate thread to truly decouple from request
-            thread = threading.Thread(
-                target=_run_agent_response_in_thread,
-                args=(player.id, session_id, agent_id, request_body.content, settings),
-                daemon=True,
+            task = asyncio.create_task(
+                _generate_agent_response_background(
+                    player.id, session_id, agent_id, request_body.content, settings
+                )
             )
-            thread.start()
+            _background_tasks.add(task)
+            task.add_done_callback(_background_tasks.discard)
             logger.info(
-                "Started background thread for agent response in session %s",
+                "Started background task for agent response in session %s",
                 session_id,
             )
         else:
@@ -1070,34 +1221,15 @@ async def compose_message(
                 session_id,
             )
 
-    return MessageDetail(
-        id=message.id,
-        channel=message.channel,
-        direction=message.direction,
-        sender_name=message.sender_name,
-        subject=message.subject,
-        content=message.content,
-        html_content=message.html_content,
-        created_at=message.created_at,
-        read_at=message.read_at,
-        session_id=message.session_id,
-    )
+    return _message_detail_response(message)
 
 
 @router.get("/api/inbox/unread-count")
 async def get_unread_count(
-    argent_session: Annotated[str | None, Cookie()] = None,
+    player: CurrentPlayer = Depends(require_web_inbox_player),
     db: AsyncSession = Depends(get_db),
-    settings: Settings = Depends(get_settings),
 ) -> dict[str, int]:
     """Get count of unread messages."""
-    if not settings.web_inbox_enabled:
-        raise HTTPException(status_code=404, detail="Web inbox not enabled")
-
-    player = await _get_current_player(argent_session, db, settings)
-    if not player:
-        raise HTTPException(status_code=401, detail="Not authenticated")
-
     inbox_service = _get_web_inbox_service(db)
     count = await inbox_service.get_unread_count(player.id)
 
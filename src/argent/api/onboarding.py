@@ -3,6 +3,7 @@
 import logging
 import secrets
 from datetime import UTC, datetime
+from functools import lru_cache
 from typing import Annotated, Any
 from uuid import UUID
 
@@ -25,6 +26,7 @@ router = APIRouter(prefix="/api", tags=["onboarding"])
 # Cookie settings
 SESSION_COOKIE_NAME = "argent_session"
 SESSION_MAX_AGE = 60 * 60 * 24 * 7  # 7 days
+SESSION_SALT = "session"
 
 
 # Request/Response models
@@ -93,8 +95,17 @@ class LoginResponse(BaseModel):
 
 
 def _create_session_serializer(settings: Settings) -> URLSafeTimedSerializer:
-    """Create a serializer for session cookies."""
-    return URLSafeTimedSerializer(settings.secret_key, salt="session")
+    """Get the serializer for session cookies."""
+    return session_serializer(settings.secret_key)
+
+
+@lru_cache(maxsize=4)
+def session_serializer(secret_key: str) -> URLSafeTimedSerializer:
+    """Build the session serializer once per secret key.
+
+    Shared by every router that reads the session cookie.
+    """
+    return URLSafeTimedSerializer(secret_key, salt=SESSION_SALT)
 
 
 def _create_session_cookie(
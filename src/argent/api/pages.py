@@ -1,15 +1,15 @@
 """HTML page routes for onboarding flow."""
 
 import logging
-from pathlib import Path
 from typing import Annotated
 
 from fastapi import APIRouter, Cookie, Depends, Request, Response, status
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from argent.api.onboarding import SESSION_MAX_AGE, session_serializer
+from argent.api.templating import create_templates
 from argent.config import Settings, get_settings
 from argent.database import get_db
 from argent.models import Player
@@ -18,9 +18,7 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(tags=["pages"])
 
-# Templates directory
-TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
-templates = Jinja2Templates(directory=str(TEMPLATES_DIR), auto_reload=True)
+templates = create_templates()
 
 
 def _get_player_id_from_session(
@@ -34,10 +32,8 @@ def _get_player_id_from_session(
     if not session_cookie:
         return None
     try:
-        from itsdangerous import URLSafeTimedSerializer
-
-        serializer = URLSafeTimedSerializer(settings.secret_key, salt="session")
-        result: str = serializer.loads(session_cookie, max_age=60 * 60 * 24 * 7)
+        serializer = session_serializer(settings.secret_key)
+        result: str = serializer.loads(session_cookie, max_age=SESSION_MAX_AGE)
         return result
     except Exception:
         return None
@@ -0,0 +1,28 @@
+"""Shared Jinja2 template setup for HTML routes."""
+
+from pathlib import Path
+
+from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache
+
+from argent.config import get_settings
+
+# Templates directory
+TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
+
+# Only re-stat template files on each render outside production
+TEMPLATES_AUTO_RELOAD = get_settings().environment != "production"
+
+
+def create_templates() -> Jinja2Templates:
+    """Create the Jinja2 templates object for a router.
+
+    Compiled templates are also cached on disk (in a per-user temp
+    directory), so fresh workers skip parsing template sources.
+
+    Returns:
+        Templates bound to the shared templates directory
+    """
+    templates = Jinja2Templates(directory=str(TEMPLATES_DIR), auto_reload=TEMPLATES_AUTO_RELOAD)
+    templates.env.bytecode_cache = FileSystemBytecodeCache(pattern="__argent_jinja2_%s.cache")
+    return templates
@@ -1,20 +1,27 @@
 """FastAPI application entry point."""
 
+import asyncio
 import logging
 import sys
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from pathlib import Path
 
+from anyio import to_thread
 from fastapi import FastAPI
-from fastapi.responses import FileResponse, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
 from argent.api.evidence import router as evidence_router
 from argent.api.health import router as health_router
+from argent.api.inbox import drain_agent_replies, start_first_contact_refill, warm_agents
 from argent.api.inbox import router as inbox_router
 from argent.api.onboarding import router as onboarding_router
 from argent.api.pages import router as pages_router
 from argent.api.webhooks import router as webhooks_router
 from argent.config import get_settings
+from argent.services.evidence import drain_access_logs
 
 settings = get_settings()
 
@@ -34,14 +41,53 @@ logging.getLogger("urllib3").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 logger.info("Starting ARGent with debug=%s, log_level=%s", settings.debug, log_level)
 
+
+# Threads for sync dependencies/endpoints and file responses (AnyIO's
+# default of 40 stalls under bursts of polling clients)
+THREADPOOL_SIZE = 200
+
+# Grace periods at shutdown for in-flight agent replies and for queued
+# evidence access log rows
+AGENT_REPLY_DRAIN_SECONDS = 10.0
+ACCESS_LOG_DRAIN_SECONDS = 5.0
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Size the threadpool, build the inbox agents and log the event loop.
+
+    The loop is uvloop under uvicorn[standard]. Miro's first contact pool
+    is refilled from this loop while the app runs. On shutdown, agent
+    replies still being generated get a few seconds to finish, and queued
+    access log rows are written.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    warm_agents(settings)
+    first_contact_refill = start_first_contact_refill(settings)
+    loop = asyncio.get_running_loop()
+    logger.info("Event loop: %s.%s", type(loop).__module__, type(loop).__name__)
+    yield
+    if first_contact_refill is not None:
+        first_contact_refill.cancel()
+    await drain_agent_replies(AGENT_REPLY_DRAIN_SECONDS)
+    await drain_access_logs(ACCESS_LOG_DRAIN_SECONDS)
+
+
 app = FastAPI(
     title=settings.app_name,
     description="An AI-driven alternate reality game",
     version="0.1.0",
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    lifespan=lifespan,
+    # orjson encodes UUID/datetime-heavy JSON payloads several times faster
+    default_response_class=ORJSONResponse,
 )
 
+# Compress HTML and JSON responses (message bodies compress well); tiny
+# responses aren't worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Mount static files
 STATIC_DIR = Path(__file__).parent / "static"
 app.mount("/static", StaticFiles(directory=str(STATIC_DIR)), name="static")
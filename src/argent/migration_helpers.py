@@ -0,0 +1,75 @@
+"""Helpers for online (non-blocking) Alembic schema migrations.
+
+Imported from scripts in alembic/versions. They live here rather than in
+that directory because Alembic loads every module there as a revision.
+"""
+
+import sqlalchemy as sa
+
+from alembic import op
+
+
+def add_fk_nonblocking(
+    table: str,
+    col: str,
+    ref_table: str,
+    ref_col: str,
+    name: str,
+    ondelete: str = "CASCADE",
+) -> None:
+    """Add a foreign key to a populated table without a long blocking scan.
+
+    The constraint is added as NOT VALID, which only checks new writes and
+    commits immediately. Existing rows are then checked by VALIDATE
+    CONSTRAINT in its own transaction, which does not block writes.
+
+    Inline ForeignKey columns are still fine for tables created empty in
+    the same migration (e.g. verification_tokens.player_id).
+
+    Args:
+        table: Table receiving the constraint
+        col: Referencing column on that table
+        ref_table: Referenced table
+        ref_col: Referenced column
+        name: Constraint name
+        ondelete: ON DELETE action
+    """
+    op.execute(
+        f"ALTER TABLE {table} ADD CONSTRAINT {name} FOREIGN KEY ({col}) "
+        f"REFERENCES {ref_table} ({ref_col}) ON DELETE {ondelete} NOT VALID"
+    )
+    with op.get_context().autocommit_block():
+        op.execute(f"ALTER TABLE {table} VALIDATE CONSTRAINT {name}")
+
+
+def create_index_concurrently(name: str, definition: str, unique: bool = False) -> None:
+    """Build an index without blocking writes, safely re-runnable.
+
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction block, so
+    the build gets an autocommit block of its own. A failed concurrent
+    build leaves an INVALID index behind; that leftover is dropped first,
+    and IF NOT EXISTS skips an index a previous run already finished.
+
+    Args:
+        name: Index name
+        definition: Everything after the name, e.g. "ON messages (session_id)"
+        unique: Build a UNIQUE index
+    """
+    invalid = sa.text("SELECT NOT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)")
+    with op.get_context().autocommit_block():
+        if op.get_bind().execute(invalid, {"name": name}).scalar():
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+        op.execute(
+            f"CREATE {'UNIQUE ' if unique else ''}INDEX CONCURRENTLY IF NOT EXISTS "
+            f"{name} {definition}"
+        )
+
+
+def drop_index_concurrently(name: str) -> None:
+    """Drop an index without blocking writes, if it exists.
+
+    Args:
+        name: Index name
+    """
+    with op.get_context().autocommit_block():
+        op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -6,7 +6,7 @@ Schema based on DATA_ARCHITECTURE.md
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import Boolean, ForeignKey, Index, Integer, Text
+from sqlalchemy import Boolean, CheckConstraint, ForeignKey, Index, Integer, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -35,6 +35,13 @@ class Player(Base, UUIDMixin, TimestampMixin):
     knowledge: Mapped[list["PlayerKnowledge"]] = relationship(back_populates="player")
     messages: Mapped[list["Message"]] = relationship(back_populates="player")
 
+    __table_args__ = (
+        CheckConstraint(
+            "communication_mode IN ('immersive', 'web_only')",
+            name="ck_players_comm_mode",
+        ),
+    )
+
 
 class PlayerKey(Base, UUIDMixin, TimestampMixin):
     """The cryptic key sent to players."""
@@ -179,4 +186,25 @@ class Message(Base, UUIDMixin, TimestampMixin):
     __table_args__ = (
         Index("idx_messages_player_recent", "player_id", "created_at", postgresql_using="btree"),
         Index("idx_messages_session", "session_id", postgresql_using="btree"),
+        # Conversation reads: filter on player + session, ordered by time
+        Index(
+            "idx_messages_player_session_created",
+            "player_id",
+            "session_id",
+            "created_at",
+            postgresql_using="btree",
+        ),
+        # Unread counts (every inbox page): only unread agent messages
+        Index(
+            "idx_messages_player_unread",
+            "player_id",
+            "channel",
+            postgresql_where=text("read_at IS NULL AND direction = 'outbound'"),
+        ),
+        # Only provider-delivered messages have an external_id
+        Index(
+            "idx_messages_external_id",
+            "external_id",
+            postgresql_where=text("external_id IS NOT NULL"),
+        ),
     )
@@ -59,11 +59,13 @@ class VerificationToken(Base, UUIDMixin, TimestampMixin):
             "expires_at",
             postgresql_where=text("used_at IS NULL"),
         ),
-        # Find active tokens for a player (for rate limiting, invalidation)
+        # Find active tokens for a player (for rate limiting, invalidation).
+        # Covering index: expiry/creation reads never touch the heap.
         Index(
             "idx_verification_tokens_player",
             "player_id",
             "token_type",
+            postgresql_include=["expires_at", "created_at"],
             postgresql_where=text("used_at IS NULL"),
         ),
     )
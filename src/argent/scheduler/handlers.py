@@ -347,7 +347,7 @@ async def handle_key_used(
 
     # For now, just log the event.
     # The knowledge fact "Player accessed the evidence dashboard"
-    # is already stored by evidence.record_dashboard_knowledge()
+    # is already stored by evidence.record_granted_access()
     # and will appear in Ember's prompt automatically.
 
     # Future: Could trigger follow-up events here
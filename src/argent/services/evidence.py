@@ -6,18 +6,42 @@ evidence dashboard (the in-fiction corporate portal).
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime
-from uuid import UUID
+from uuid import uuid4
 
 from fastapi import Request
-from sqlalchemy import select
+from sqlalchemy import exists, func, insert, literal, select, update
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
 
+from argent.database import async_session_maker
 from argent.models.player import KeyAccessLog, PlayerKey, PlayerKnowledge
 
 logger = logging.getLogger(__name__)
 
+# Knowledge fact recorded on dashboard access (Ember reacts to it)
+DASHBOARD_FACT = "Player accessed the evidence dashboard"
+
+# Short-lived cache of keys that do not exist, so repeated guesses skip the
+# lookup: normalized key -> expires at. Found keys are never cached; their
+# access counts change with every granted access.
+KEY_CACHE_TTL_SECONDS = 10.0
+KEY_CACHE_SIZE = 2048
+_missing_key_cache: OrderedDict[str, float] = OrderedDict()
+
+# Access log rows are written off the request path, in batches, by a
+# background task with its own session
+ACCESS_LOG_QUEUE_SIZE = 10_000
+ACCESS_LOG_BATCH_SIZE = 100
+ACCESS_LOG_FLUSH_SECONDS = 0.1
+_access_log_queue: asyncio.Queue[dict] | None = None
+_access_log_flusher: asyncio.Task[None] | None = None
+
 
 async def validate_key(db: AsyncSession, key_value: str) -> PlayerKey | None:
     """Validate a key exists in the database.
@@ -26,19 +50,36 @@ async def validate_key(db: AsyncSession, key_value: str) -> PlayerKey | None:
         db: Database session
         key_value: The key string (format: XXXX-XXXX-XXXX-XXXX)
 
+    Misses are cached for KEY_CACHE_TTL_SECONDS.
+
     Returns:
         PlayerKey if found, None otherwise
     """
     # Normalize key format (uppercase, with dashes)
     normalized = key_value.strip().upper()
 
+    now = time.monotonic()
+    expires_at = _missing_key_cache.get(normalized)
+    if expires_at is not None and expires_at > now:
+        return None
+
     result = await db.execute(select(PlayerKey).where(PlayerKey.key_value == normalized))
-    return result.scalar_one_or_none()
+    player_key = result.scalar_one_or_none()
+
+    if player_key is None:
+        _missing_key_cache[normalized] = now + KEY_CACHE_TTL_SECONDS
+        _missing_key_cache.move_to_end(normalized)
+        if len(_missing_key_cache) > KEY_CACHE_SIZE:
+            _missing_key_cache.popitem(last=False)
+
+    return player_key
 
 
 async def check_access_limit(key: PlayerKey) -> bool:
     """Check if key still has remaining accesses.
 
+    A fast path only: record_granted_access enforces the limit atomically.
+
     Args:
         key: The PlayerKey to check
 
@@ -49,121 +90,223 @@ async def check_access_limit(key: PlayerKey) -> bool:
 
 
 async def log_access(
-    db: AsyncSession,
     key: PlayerKey,
     success: bool,
     request: Request,
-) -> KeyAccessLog:
+) -> None:
     """Log an access attempt to the evidence dashboard.
 
+    The row is queued and written in a batch shortly after, so the
+    request never waits on the insert.
+
     Args:
-        db: Database session
         key: The PlayerKey being accessed
         success: Whether access was granted
         request: FastAPI request for IP/user-agent
-
-    Returns:
-        The created KeyAccessLog entry
     """
-    # Get IP address (handle proxies)
-    ip_address = request.client.host if request.client else None
-    forwarded = request.headers.get("x-forwarded-for")
-    if forwarded:
-        ip_address = forwarded.split(",")[0].strip()
-
-    user_agent = request.headers.get("user-agent", "")[:500]  # Truncate long UAs
-
-    log_entry = KeyAccessLog(
-        player_id=key.player_id,
-        key_id=key.id,
-        accessed_at=datetime.now(UTC),
-        success=success,
-        ip_address=ip_address,
-        user_agent=user_agent,
-    )
-    db.add(log_entry)
+    ip_address = _enqueue_access_log(key, success, request)
 
     logger.info(
-        "Dashboard access %s: key=%s player=%s ip=%s",
+        "Dashboard access %s: key=%.9s... player=%s ip=%s",
         "granted" if success else "denied",
-        key.key_value[:9] + "...",
+        key.key_value,
         key.player_id,
         ip_address,
     )
 
-    return log_entry
 
+async def record_granted_access(
+    db: AsyncSession,
+    key: PlayerKey,
+    request: Request,
+) -> bool:
+    """Count a granted access, record the dashboard fact, and log it.
 
-async def increment_access(db: AsyncSession, key: PlayerKey) -> None:
-    """Increment access count and set first access timestamp.
+    The count is incremented only while it is below the key's limit, in the
+    same UPDATE, so concurrent requests can never push a key past its
+    limit. The count and the fact go out as one statement (data-modifying
+    CTEs), so a granted access costs a single round-trip before the commit.
+    The fact is only recorded when the count went up. The new count is
+    copied back onto ``key``, and the log row is queued like log_access.
 
     Args:
         db: Database session
-        key: The PlayerKey to update
+        key: The PlayerKey being accessed
+        request: FastAPI request for IP/user-agent
+
+    Returns:
+        True if the access was counted, False if the limit was exhausted
     """
-    key.access_count += 1
+    now = datetime.now(UTC)
+
+    granted = (
+        update(PlayerKey)
+        .where(PlayerKey.id == key.id)
+        .where(PlayerKey.access_count < PlayerKey.access_limit)
+        .values(
+            access_count=PlayerKey.access_count + 1,
+            first_accessed_at=func.coalesce(PlayerKey.first_accessed_at, now),
+        )
+        .returning(PlayerKey.access_count, PlayerKey.first_accessed_at)
+        .cte("granted")
+    )
 
-    if key.first_accessed_at is None:
-        key.first_accessed_at = datetime.now(UTC)
+    # Record the fact only once per player, and only for a counted access
+    knowledge_insert = (
+        insert(PlayerKnowledge)
+        .from_select(
+            ["id", "player_id", "fact", "category", "learned_at"],
+            select(
+                literal(uuid4(), PG_UUID(as_uuid=True)),
+                literal(key.player_id, PG_UUID(as_uuid=True)),
+                literal(DASHBOARD_FACT),
+                literal("dashboard"),
+                literal(now),
+            )
+            .select_from(granted)
+            .where(
+                ~exists().where(
+                    PlayerKnowledge.player_id == key.player_id,
+                    PlayerKnowledge.fact == DASHBOARD_FACT,
+                )
+            ),
+        )
+        .cte("knowledge_insert")
+    )
+
+    stmt = select(granted.c.access_count, granted.c.first_accessed_at).add_cte(knowledge_insert)
+    row = (await db.execute(stmt)).one_or_none()
+    ip_address = _enqueue_access_log(key, row is not None, request)
+
+    if row is None:
+        logger.info(
+            "Dashboard access denied at limit: key=%.9s... player=%s ip=%s",
+            key.key_value,
+            key.player_id,
+            ip_address,
+        )
+        return False
+
+    # Keep the loaded key in sync without scheduling another UPDATE
+    set_committed_value(key, "access_count", row.access_count)
+    set_committed_value(key, "first_accessed_at", row.first_accessed_at)
 
     logger.info(
-        "Key access count: %d/%d for key=%s",
+        "Dashboard access granted: key=%.9s... player=%s ip=%s count=%d/%d",
+        key.key_value,
+        key.player_id,
+        ip_address,
         key.access_count,
         key.access_limit,
-        key.key_value[:9] + "...",
     )
+    return True
 
 
-async def record_dashboard_knowledge(
-    db: AsyncSession,
-    player_id: UUID,
-) -> PlayerKnowledge | None:
-    """Record that player accessed the evidence dashboard.
-
-    This fact will appear in agent prompts, allowing Ember to know
-    when the player has betrayed their trust.
+async def get_remaining_accesses(key: PlayerKey) -> int:
+    """Get number of remaining accesses for a key.
 
     Args:
-        db: Database session
-        player_id: The player's UUID
+        key: The PlayerKey to check
 
     Returns:
-        The created knowledge record, or None if already exists
+        Number of remaining accesses (0 if exhausted)
     """
-    # Check if already recorded
-    fact_text = "Player accessed the evidence dashboard"
-    result = await db.execute(
-        select(PlayerKnowledge).where(
-            PlayerKnowledge.player_id == player_id,
-            PlayerKnowledge.fact == fact_text,
-        )
-    )
-    existing = result.scalar_one_or_none()
+    return max(0, key.access_limit - key.access_count)
 
-    if existing:
-        logger.debug("Dashboard access already recorded for player=%s", player_id)
-        return None
 
-    knowledge = PlayerKnowledge(
-        player_id=player_id,
-        fact=fact_text,
-        category="dashboard",
-        source_agent=None,  # System-generated
-        learned_at=datetime.now(UTC),
-    )
-    db.add(knowledge)
+def _client_info(request: Request) -> tuple[str | None, str]:
+    """Get the client IP (handling proxies) and truncated user agent."""
+    ip_address = request.client.host if request.client else None
+    forwarded = request.headers.get("x-forwarded-for")
+    if forwarded:
+        ip_address = forwarded.split(",")[0].strip()
 
-    logger.info("Recorded dashboard access for player=%s", player_id)
-    return knowledge
+    user_agent = request.headers.get("user-agent", "")[:500]  # Truncate long UAs
+    return ip_address, user_agent
 
 
-async def get_remaining_accesses(key: PlayerKey) -> int:
-    """Get number of remaining accesses for a key.
+def _enqueue_access_log(key: PlayerKey, success: bool, request: Request) -> str | None:
+    """Queue an access log row for the background writer.
 
-    Args:
-        key: The PlayerKey to check
+    Drops the oldest queued row if the writer has fallen far behind.
 
     Returns:
-        Number of remaining accesses (0 if exhausted)
+        The client IP address recorded
     """
-    return max(0, key.access_limit - key.access_count)
+    global _access_log_queue, _access_log_flusher
+
+    ip_address, user_agent = _client_info(request)
+    row = {
+        "id": uuid4(),
+        "player_id": key.player_id,
+        "key_id": key.id,
+        "accessed_at": datetime.now(UTC),
+        "success": success,
+        "ip_address": ip_address,
+        "user_agent": user_agent,
+    }
+
+    # The queue and writer belong to the running event loop
+    loop = asyncio.get_running_loop()
+    if _access_log_queue is None or (
+        _access_log_flusher is not None and _access_log_flusher.get_loop() is not loop
+    ):
+        _access_log_queue = asyncio.Queue(maxsize=ACCESS_LOG_QUEUE_SIZE)
+        _access_log_flusher = None
+
+    if _access_log_queue.full():
+        _access_log_queue.get_nowait()
+        _access_log_queue.task_done()
+        logger.warning("Access log queue full, dropped oldest row")
+    _access_log_queue.put_nowait(row)
+
+    if _access_log_flusher is None or _access_log_flusher.done():
+        _access_log_flusher = loop.create_task(_flush_access_logs(_access_log_queue))
+
+    return ip_address
+
+
+async def _flush_access_logs(queue: asyncio.Queue[dict]) -> None:
+    """Write queued access log rows in batches, forever."""
+    while True:
+        rows = [await queue.get()]
+
+        # Give a burst a moment to accumulate, then take up to a batch
+        await asyncio.sleep(ACCESS_LOG_FLUSH_SECONDS)
+        while len(rows) < ACCESS_LOG_BATCH_SIZE and not queue.empty():
+            rows.append(queue.get_nowait())
+
+        try:
+            async with async_session_maker() as session:
+                await session.execute(insert(KeyAccessLog), rows)
+                await session.commit()
+        except Exception as e:
+            logger.error("Failed to write %d access log rows: %s", len(rows), e)
+        finally:
+            for _ in rows:
+                queue.task_done()
+
+
+async def drain_access_logs(timeout: float) -> None:
+    """Write the queued access log rows and stop the writer, e.g. on shutdown.
+
+    Args:
+        timeout: Seconds to wait for queued rows before dropping them
+    """
+    global _access_log_queue, _access_log_flusher
+
+    queue, flusher = _access_log_queue, _access_log_flusher
+    _access_log_queue = _access_log_flusher = None
+    if queue is None or flusher is None:
+        return
+    # A writer on another (already closed) loop cannot be awaited from here
+    if flusher.get_loop() is not asyncio.get_running_loop():
+        return
+
+    if not flusher.done():
+        try:
+            await asyncio.wait_for(queue.join(), timeout)
+        except TimeoutError:
+            logger.warning("Shutting down with %d access log rows unwritten", queue.qsize())
+    flusher.cancel()
+    await asyncio.gather(flusher, return_exceptions=True)
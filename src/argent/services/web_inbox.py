@@ -9,8 +9,9 @@ from datetime import UTC, datetime
 from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import CTE, ColumnElement, Row, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import raiseload
 
 from argent.models.player import Message
 from argent.services.base import (
@@ -24,6 +25,12 @@ from argent.services.base import (
 
 logger = logging.getLogger(__name__)
 
+# Characters of message content fetched for conversation list previews
+PREVIEW_LENGTH = 100
+
+# Rows fetched per server-side cursor batch when streaming whole inboxes
+STREAM_BATCH_SIZE = 100
+
 
 class WebInboxService(BaseChannelService):
     """Database-backed inbox for non-immersive mode.
@@ -52,7 +59,10 @@ class WebInboxService(BaseChannelService):
         return SendResult(success=True, external_id=f"web-{db_message.id}")
 
     async def send_and_store(
-        self, message: OutboundMessage, display_channel: str = "email"
+        self,
+        message: OutboundMessage,
+        display_channel: str = "email",
+        classification: dict | None = None,
     ) -> Message:
         """Store message in database and return the Message record.
 
@@ -62,6 +72,8 @@ class WebInboxService(BaseChannelService):
         Args:
             message: The message to store
             display_channel: How to display this message - 'email' or 'sms'
+            classification: Extracted insights, if already known (saved in
+                the same INSERT rather than a later UPDATE)
 
         Returns:
             The created Message object
@@ -88,6 +100,9 @@ class WebInboxService(BaseChannelService):
             sender_name=sender_name,
             delivered_at=datetime.now(UTC),
         )
+        if classification is not None:
+            db_message.classification = classification
+            db_message.classified_at = datetime.now(UTC)
 
         self._db.add(db_message)
         await self._db.flush()
@@ -187,7 +202,10 @@ class WebInboxService(BaseChannelService):
         """Get conversation summaries for inbox view.
 
         Groups messages by session_id and returns the latest message
-        from each conversation.
+        from each conversation. Only summary columns and a preview of each
+        message's content are fetched, never full message bodies. Rows are
+        streamed in batches of STREAM_BATCH_SIZE and folded into per-session
+        totals as they arrive, so large inboxes are never held in memory.
 
         Args:
             player_id: The player's ID
@@ -199,28 +217,42 @@ class WebInboxService(BaseChannelService):
         """
         # Get all messages for player, grouped by session
         query = (
-            select(Message)
+            select(
+                Message.id,
+                Message.session_id,
+                Message.agent_id,
+                Message.channel,
+                Message.sender_name,
+                Message.read_at,
+                Message.created_at,
+                func.substring(Message.content, 1, PREVIEW_LENGTH).label("preview"),
+            )
             .where(Message.player_id == player_id)
             .order_by(Message.created_at.desc())
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
         )
 
-        result = await self._db.execute(query)
-        messages = list(result.scalars().all())
-
-        # Group by session_id
-        conversations: dict[str | None, list[Message]] = {}
-        for msg in messages:
-            session_key = msg.session_id or f"single-{msg.id}"
-            if session_key not in conversations:
-                conversations[session_key] = []
-            conversations[session_key].append(msg)
+        # Per session: latest row, message count, unread count, participants
+        conversations: dict[str, tuple[Row[Any], list[int], set[str]]] = {}
+        result = await self._db.stream(query)
+        async for row in result:
+            session_key = row.session_id or f"single-{row.id}"
+            conversation = conversations.get(session_key)
+            if conversation is None:
+                # Rows arrive newest first, so the first one is the latest
+                conversation = (row, [0, 0], set())
+                conversations[session_key] = conversation
+            _, counts, participants = conversation
+            counts[0] += 1
+            if row.read_at is None:
+                counts[1] += 1
+            if row.sender_name:
+                participants.add(row.sender_name)
 
         # Build summaries
         summaries = []
-        for session_id, session_messages in conversations.items():
-            latest = session_messages[0]  # Already sorted by created_at desc
-            unread_count = sum(1 for m in session_messages if m.read_at is None)
-
+        for session_id, (latest, counts, participants) in conversations.items():
+            message_count, unread_count = counts
             # Determine conversation channel from first message
             # Default to 'email' for legacy messages stored as 'web'
             conv_channel = latest.channel
@@ -232,7 +264,6 @@ class WebInboxService(BaseChannelService):
                 continue
 
             # Determine conversation title from participants
-            participants = {m.sender_name for m in session_messages if m.sender_name}
             participants.discard("You")
             title = ", ".join(sorted(participants)) if participants else "Unknown"
 
@@ -241,8 +272,9 @@ class WebInboxService(BaseChannelService):
                     "session_id": session_id,
                     "title": title,
                     "channel": conv_channel,
-                    "latest_message": latest,
-                    "message_count": len(session_messages),
+                    "agent_id": latest.agent_id,
+                    "preview": latest.preview or "",
+                    "message_count": message_count,
                     "unread_count": unread_count,
                     "updated_at": latest.created_at,
                 }
@@ -256,36 +288,109 @@ class WebInboxService(BaseChannelService):
         self,
         player_id: UUID,
         session_id: str,
+        mark_read: bool = False,
     ) -> list[Message]:
         """Get all messages in a conversation thread.
 
         Args:
             player_id: The player's ID (for security check)
             session_id: The session/conversation ID
+            mark_read: Also mark the thread read, in the same statement. The
+                returned messages keep the read_at they had before (the
+                SELECT sees the pre-update snapshot) until they are loaded
+                again.
 
         Returns:
             List of messages in chronological order
         """
+        # Views only read message columns; fail loudly instead of lazy
+        # loading a relationship once per message
         query = (
             select(Message)
+            .options(raiseload("*"))
             .where(Message.player_id == player_id)
             .where(Message.session_id == session_id)
             .order_by(Message.created_at.asc())
+            # Refresh messages already in the session, e.g. one loaded by
+            # get_message(mark_read=True) with its pre-update read_at
+            .execution_options(populate_existing=True)
         )
+        if mark_read:
+            query = query.add_cte(
+                _mark_read_cte(
+                    Message.player_id == player_id,
+                    Message.session_id == session_id,
+                )
+            )
 
         result = await self._db.execute(query)
         return list(result.scalars().all())
 
+    async def get_conversation_version(
+        self,
+        player_id: UUID,
+        session_id: str,
+    ) -> str:
+        """Get a version string that changes whenever a conversation does.
+
+        Covers new messages and messages being read, from one aggregate
+        query; suitable as an ETag.
+
+        Args:
+            player_id: The player's ID (for security check)
+            session_id: The session/conversation ID
+
+        Returns:
+            Version string for the conversation's current messages
+        """
+        result = await self._db.execute(
+            select(func.max(Message.created_at), func.count(), func.count(Message.read_at))
+            .where(Message.player_id == player_id)
+            .where(Message.session_id == session_id)
+        )
+        latest, total, read = result.one()
+        latest_us = int(latest.timestamp() * 1_000_000) if latest else 0
+        return f"{latest_us}-{total}-{read}"
+
+    async def get_conversation_participants(
+        self,
+        player_id: UUID,
+        session_id: str,
+    ) -> list[str]:
+        """Get the distinct agent-side participants of a conversation.
+
+        Args:
+            player_id: The player's ID (for security check)
+            session_id: The session/conversation ID
+
+        Returns:
+            Sender names, sorted, excluding the player ("You")
+        """
+        result = await self._db.execute(
+            select(Message.sender_name)
+            .distinct()
+            .where(Message.player_id == player_id)
+            .where(Message.session_id == session_id)
+            .where(Message.sender_name.is_not(None))
+            .where(Message.sender_name != "You")
+            .order_by(Message.sender_name)
+        )
+        return [name for name in result.scalars() if name]
+
     async def get_message(
         self,
         player_id: UUID,
         message_id: UUID,
+        mark_read: bool = False,
     ) -> Message | None:
         """Get a single message by ID.
 
         Args:
             player_id: The player's ID (for security check)
             message_id: The message ID
+            mark_read: Also mark the message read, in the same statement. The
+                returned message keeps the read_at it had before (the SELECT
+                sees the pre-update snapshot) until it is loaded again.
 
         Returns:
             The message if found and owned by player, else None
@@ -293,6 +398,10 @@ class WebInboxService(BaseChannelService):
         query = (
             select(Message).where(Message.id == message_id).where(Message.player_id == player_id)
         )
+        if mark_read:
+            query = query.add_cte(
+                _mark_read_cte(Message.id == message_id, Message.player_id == player_id)
+            )
 
         result = await self._db.execute(query)
         return result.scalar_one_or_none()
@@ -304,18 +413,19 @@ class WebInboxService(BaseChannelService):
     ) -> bool:
         """Mark a message as read.
 
+        Runs as a single UPDATE; an already read message keeps its read_at.
+
         Returns:
             True if message was updated, False if not found
         """
-        message = await self.get_message(player_id, message_id)
-        if not message:
-            return False
-
-        if message.read_at is None:
-            message.read_at = datetime.now(UTC)
-            await self._db.flush()
-
-        return True
+        result = await self._db.execute(
+            update(Message)
+            .where(Message.id == message_id)
+            .where(Message.player_id == player_id)
+            .values(read_at=func.coalesce(Message.read_at, datetime.now(UTC)))
+        )
+        count: int = result.rowcount  # type: ignore[attr-defined]
+        return count > 0
 
     async def mark_conversation_read(
         self,
@@ -324,21 +434,20 @@ class WebInboxService(BaseChannelService):
     ) -> int:
         """Mark all messages in a conversation as read.
 
+        Runs as a single UPDATE; messages already loaded in this session
+        get their read_at updated too.
+
         Returns:
             Number of messages marked as read
         """
-        messages = await self.get_conversation_messages(player_id, session_id)
-        count = 0
-
-        now = datetime.now(UTC)
-        for msg in messages:
-            if msg.read_at is None:
-                msg.read_at = now
-                count += 1
-
-        if count > 0:
-            await self._db.flush()
-
+        result = await self._db.execute(
+            update(Message)
+            .where(Message.player_id == player_id)
+            .where(Message.session_id == session_id)
+            .where(Message.read_at.is_(None))
+            .values(read_at=datetime.now(UTC))
+        )
+        count: int = result.rowcount  # type: ignore[attr-defined]
         return count
 
     async def get_unread_count(self, player_id: UUID, channel_filter: str | None = None) -> int:
@@ -349,7 +458,8 @@ class WebInboxService(BaseChannelService):
             channel_filter: Optional filter by channel ('email' or 'sms')
         """
         query = (
-            select(Message)
+            select(func.count())
+            .select_from(Message)
             .where(Message.player_id == player_id)
             .where(Message.read_at.is_(None))
             .where(Message.direction == Direction.OUTBOUND.value)  # Only agent messages
@@ -359,7 +469,26 @@ class WebInboxService(BaseChannelService):
             query = query.where(Message.channel == channel_filter)
 
         result = await self._db.execute(query)
-        return len(list(result.scalars().all()))
+        count: int = result.scalar_one()
+        return count
+
+    async def get_unread_counts_by_channel(self, player_id: UUID) -> dict[str, int]:
+        """Get unread message counts for every channel in one query.
+
+        Args:
+            player_id: The player's ID
+
+        Returns:
+            Mapping of channel to unread count (channels with none are absent)
+        """
+        result = await self._db.execute(
+            select(Message.channel, func.count())
+            .where(Message.player_id == player_id)
+            .where(Message.read_at.is_(None))
+            .where(Message.direction == Direction.OUTBOUND.value)  # Only agent messages
+            .group_by(Message.channel)
+        )
+        return dict(result.tuples())
 
     async def parse_webhook(self, payload: dict[str, Any]) -> InboundMessage:
         """Parse webhook - not used for web inbox, messages come via API."""
@@ -390,3 +519,27 @@ class WebInboxService(BaseChannelService):
             return agent_id.title()
         else:
             return "Unknown"
+
+
+def _mark_read_cte(*criteria: ColumnElement[bool]) -> CTE:
+    """Build a data-modifying CTE marking unread messages read.
+
+    Attached to a SELECT, the UPDATE runs in the same round trip. The
+    SELECT reads the snapshot from before the update, so it still returns
+    the old read_at. Statements that run later in the transaction see
+    the new value.
+
+    Args:
+        criteria: Conditions selecting the messages to mark
+
+    Returns:
+        The CTE, to pass to ``Select.add_cte``
+    """
+    return (
+        update(Message)
+        .where(*criteria)
+        .where(Message.read_at.is_(None))
+        .values(read_at=datetime.now(UTC))
+        .returning(Message.id)
+        .cte("marked_read")
+    )
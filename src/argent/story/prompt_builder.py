@@ -4,12 +4,38 @@ Transforms AgentPersona dataclass into LLM system prompts with
 dynamic context injection (trust, knowledge, conversation state).
 """
 
+from bisect import bisect_right
+
 from argent.story.persona import AgentPersona
 
+# Lower bounds (inclusive) of each trust band above "Very Low"
+TRUST_THRESHOLDS = (-30, 0, 30, 60)
+
+# One description per band, lowest first (len(TRUST_THRESHOLDS) + 1 entries)
+TRUST_DESCRIPTIONS = (
+    "Very Low - deeply worried about this person. "
+    "Minimal engagement. May threaten to stop talking. "
+    "Don't help them use the key. Consider: 'I don't think we have anything to discuss.'",
+    "Low - they've done concerning things. Shorter responses, less helpful, consider disengaging.",
+    "Neutral - still unsure. Be helpful but guarded. Don't volunteer extra information.",
+    "Moderate - willing to listen. Standard engagement, reciprocate their cooperation.",
+    "High - the player has been cooperative. "
+    "You can share more freely, be warmer, offer extra intel.",
+)
+
 
 class PromptBuilder:
     """Builds system prompts from agent personas with dynamic context."""
 
+    def __init__(self) -> None:
+        # Persona-only prompt sections, rendered once per persona:
+        # agent_id -> (persona, sections before context, sections after)
+        self._static_sections: dict[str, tuple[AgentPersona, str, str]] = {}
+
+        # First contact prompt around the key slot, rendered once per persona:
+        # agent_id -> (persona, text before the key, text after the key)
+        self._first_contact_parts: dict[str, tuple[AgentPersona, str, str]] = {}
+
     def build_system_prompt(
         self,
         persona: AgentPersona,
@@ -22,6 +48,9 @@ class PromptBuilder:
     ) -> str:
         """Build complete system prompt with dynamic context.
 
+        The static prefix (persona, rules, format) comes first and the
+        per-turn context last, separated by a horizontal rule.
+
         Args:
             persona: The agent's persona definition
             trust_score: Current trust level (-100 to 100)
@@ -34,43 +63,117 @@ class PromptBuilder:
         Returns:
             Complete system prompt for the agent
         """
-        sections = [
-            self._build_header(persona),
-            self._build_background(persona),
-            self._build_personality(persona),
-            self._build_voice(persona),
-            self._build_knowledge(persona),
-            self._build_reactions(persona),
-            self._build_context(trust_score, player_knowledge, conversation_history),
-        ]
+        # All persona-only text comes first so consecutive calls share the
+        # longest possible prefix (Gemini's implicit prefix caching)
+        static_prefix = self.build_static_prefix(persona)
+        dynamic_suffix = self.build_dynamic_suffix(
+            persona,
+            trust_score=trust_score,
+            player_knowledge=player_knowledge,
+            conversation_history=conversation_history,
+            player_key=player_key,
+            communication_mode=communication_mode,
+            base_url=base_url,
+        )
+        return f"{static_prefix}\n\n---\n\n{dynamic_suffix}"
+
+    def build_static_prefix(self, persona: AgentPersona) -> str:
+        """Build the invariant part of the system prompt.
+
+        Contains only persona-derived sections, so the text is identical for
+        every call and can be cached by the model provider.
+
+        Args:
+            persona: The agent's persona definition
+
+        Returns:
+            Static system prompt for the agent
+        """
+        head, tail = self._get_static_sections(persona)
+        sections = [head]
+        if persona.agent_id == "miro":
+            sections.append(self._build_miro_intel())
+        sections.append(tail)
+        return "\n\n".join(sections)
+
+    def _get_static_sections(self, persona: AgentPersona) -> tuple[str, str]:
+        """Get the persona-only sections that surround the dynamic context.
+
+        Personas never change after registration, so these are rendered
+        once and reused. A different persona object under the same ID
+        (e.g. after the registry is reset) is rendered afresh.
+
+        Args:
+            persona: The agent's persona definition
+
+        Returns:
+            Tuple of (header through reactions, rules through response format)
+        """
+        cached = self._static_sections.get(persona.agent_id)
+        if cached is not None and cached[0] is persona:
+            return cached[1], cached[2]
+
+        head = "\n\n".join(
+            [
+                self._build_header(persona),
+                self._build_background(persona),
+                self._build_personality(persona),
+                self._build_voice(persona),
+                self._build_knowledge(persona),
+                self._build_reactions(persona),
+            ]
+        )
+        tail = "\n\n".join(
+            [
+                self._build_rules(persona),
+                self._build_examples(persona),
+                self._build_response_format(persona),
+            ]
+        )
+        self._static_sections[persona.agent_id] = (persona, head, tail)
+        return head, tail
+
+    def build_dynamic_suffix(
+        self,
+        persona: AgentPersona,
+        trust_score: int = 0,
+        player_knowledge: list[str] | None = None,
+        conversation_history: list[dict] | None = None,
+        player_key: str | None = None,
+        communication_mode: str = "immersive",
+        base_url: str = "http://localhost:8000",
+    ) -> str:
+        """Build the per-turn part of the prompt (trust, knowledge, history).
+
+        Args:
+            persona: The agent's persona definition
+            trust_score: Current trust level (-100 to 100)
+            player_knowledge: List of facts the player has learned
+            conversation_history: Previous messages in this conversation
+            player_key: The player's unique key (for betrayal/portal context)
+            communication_mode: "immersive" (real email/SMS) or "web-only"
+            base_url: The application base URL (for portal links)
+
+        Returns:
+            Dynamic context to send alongside the player's message
+        """
+        sections = [self._build_context(trust_score, player_knowledge, conversation_history)]
 
-        # Add portal URL context for moderate+ trust conversations
-        # At trust 20+, agents can give the URL if player engages well
         if player_key and trust_score >= 20:
-            portal_context = self._build_portal_url_context(
-                player_key, communication_mode, base_url
+            sections.append(
+                self._build_portal_url_context(player_key, communication_mode, base_url)
             )
-            sections.append(portal_context)
 
-        # Add agent-specific sections
         if persona.agent_id == "ember":
             betrayal_context = self._build_dashboard_betrayal_context(player_knowledge, player_key)
             if betrayal_context:
                 sections.append(betrayal_context)
 
         if persona.agent_id == "miro":
-            sections.append(self._build_miro_intel())
             progression = self._build_miro_progression_hints(trust_score, player_knowledge)
             if progression:
                 sections.append(progression)
 
-        sections.extend(
-            [
-                self._build_rules(persona),
-                self._build_examples(persona),
-                self._build_response_format(persona),
-            ]
-        )
         return "\n\n".join(sections)
 
     def build_first_contact_prompt(
@@ -87,13 +190,28 @@ class PromptBuilder:
         Returns:
             System prompt for generating first contact
         """
-        fc = persona.first_contact
-
-        # Handle different agents differently
+        cached = self._first_contact_parts.get(persona.agent_id)
+        if cached is None or cached[0] is not persona:
+            # Handle different agents differently
+            if persona.agent_id == "miro":
+                head, tail = self._build_miro_first_contact_prompt(persona), ""
+            else:
+                head, tail = self._build_ember_first_contact_parts(persona)
+            cached = (persona, head, tail)
+            self._first_contact_parts[persona.agent_id] = cached
+
+        _, head, tail = cached
         if persona.agent_id == "miro":
-            return self._build_miro_first_contact_prompt(persona)
+            return head  # Miro's prompt has no key slot
+        return head + key + tail
+
+    def _build_ember_first_contact_parts(self, persona: AgentPersona) -> tuple[str, str]:
+        """Build Ember's first contact prompt, split around the key.
 
-        # Default: Ember's first contact (with key)
+        Returns:
+            Tuple of (text before the key, text after the key)
+        """
+        fc = persona.first_contact
         lines = [
             f"# CHARACTER: {persona.display_name.upper()} - FIRST CONTACT",
             "",
@@ -145,12 +263,10 @@ class PromptBuilder:
                 "",
                 "---",
                 "",
-                f"The key to include is: {key}",
-                "",
-                "Write the message now. Be BRIEF and CRYPTIC.",
+                "The key to include is: ",
             ]
         )
-        return "\n".join(lines)
+        return "\n".join(lines), "\n\nWrite the message now. Be BRIEF and CRYPTIC."
 
     def _build_miro_first_contact_prompt(self, persona: AgentPersona) -> str:
         """Build Miro's first contact prompt (SMS, no key)."""
@@ -575,30 +691,7 @@ class PromptBuilder:
 
     def _trust_to_description(self, trust_score: int) -> str:
         """Convert numeric trust score to natural language description with behavioral guidance."""
-        if trust_score >= 60:
-            return (
-                "High - the player has been cooperative. "
-                "You can share more freely, be warmer, offer extra intel."
-            )
-        elif trust_score >= 30:
-            return (
-                "Moderate - willing to listen. Standard engagement, reciprocate their cooperation."
-            )
-        elif trust_score >= 0:
-            return (
-                "Neutral - still unsure. Be helpful but guarded. Don't volunteer extra information."
-            )
-        elif trust_score >= -30:
-            return (
-                "Low - they've done concerning things. "
-                "Shorter responses, less helpful, consider disengaging."
-            )
-        else:
-            return (
-                "Very Low - deeply worried about this person. "
-                "Minimal engagement. May threaten to stop talking. "
-                "Don't help them use the key. Consider: 'I don't think we have anything to discuss.'"
-            )
+        return TRUST_DESCRIPTIONS[bisect_right(TRUST_THRESHOLDS, trust_score)]
 
     def _format_knowledge(self, knowledge: list[str]) -> str:
         """Format player knowledge as context."""
@@ -1,5 +1,7 @@
 """Tests for EmberAgent and prompt building."""
 
+import dataclasses
+
 import pytest
 
 from argent.story import PromptBuilder, load_character
@@ -66,6 +68,67 @@ class TestPromptBuilder:
         assert "Player mentioned Miro" in prompt
         assert "Player asked about Thursday" in prompt
 
+    def test_static_prefix_excludes_dynamic_context(self):
+        """Test that the cacheable prefix holds no per-turn context."""
+        persona = load_character("miro")
+        builder = PromptBuilder()
+        prefix = builder.build_static_prefix(persona)
+        suffix = builder.build_dynamic_suffix(
+            persona,
+            trust_score=50,
+            player_knowledge=["Player mentioned Ember"],
+        )
+
+        assert "CURRENT CONTEXT" not in prefix
+        assert "Player mentioned Ember" not in prefix
+        assert "CURRENT CONTEXT" in suffix
+        assert "Player mentioned Ember" in suffix
+
+    def test_system_prompt_starts_with_static_prefix(self):
+        """Test that per-turn context never precedes persona text."""
+        persona = load_character("ember")
+        builder = PromptBuilder()
+        prompt = builder.build_system_prompt(
+            persona,
+            trust_score=50,
+            player_knowledge=["Player mentioned Miro"],
+        )
+
+        assert prompt.startswith(builder.build_static_prefix(persona))
+
+    def test_static_sections_rebuilt_for_new_persona(self):
+        """Test that cached persona sections follow a replaced persona."""
+        persona = load_character("ember")
+        builder = PromptBuilder()
+        builder.build_system_prompt(persona)
+
+        renamed = dataclasses.replace(persona, display_name="Ash")
+        prompt = builder.build_system_prompt(renamed)
+
+        assert "# CHARACTER: ASH" in prompt
+        assert "# CHARACTER: EMBER" not in prompt
+
+    @pytest.mark.parametrize(
+        ("trust_score", "band"),
+        [
+            (-100, "Very Low"),
+            (-31, "Very Low"),
+            (-30, "Low"),
+            (-1, "Low"),
+            (0, "Neutral"),
+            (29, "Neutral"),
+            (30, "Moderate"),
+            (59, "Moderate"),
+            (60, "High"),
+            (100, "High"),
+        ],
+    )
+    def test_trust_description_boundaries(self, trust_score, band):
+        """Test that each band starts at its threshold (inclusive)."""
+        description = PromptBuilder()._trust_to_description(trust_score)
+
+        assert description.startswith(f"{band} - ")
+
 
 class TestPersonaLoading:
     """Test persona registry and loading."""
@@ -97,3 +160,34 @@ class TestPersonaLoading:
         """Test that loading unknown agent raises ValueError."""
         with pytest.raises(ValueError, match="Unknown agent"):
             load_character("nonexistent_agent")
+
+
+class TestSubjectExtraction:
+    """Test splitting the optional subject line off Ember's replies."""
+
+    def test_extracts_subject_and_body(self):
+        """Test that a leading subject line is split from the body."""
+        from argent.agents.ember import _split_subject
+
+        subject, content = _split_subject("Subject: Thursday\n\nUse it.\n\n- E")
+
+        assert subject == "Thursday"
+        assert content == "Use it.\n\n- E"
+
+    def test_subject_prefix_is_case_insensitive(self):
+        """Test that the subject prefix matches regardless of case."""
+        from argent.agents.ember import _split_subject
+
+        subject, content = _split_subject("SUBJECT: Please")
+
+        assert subject == "Please"
+        assert content == ""
+
+    def test_no_subject_returns_full_text(self):
+        """Test that replies without a subject line are returned unchanged."""
+        from argent.agents.ember import _split_subject
+
+        subject, content = _split_subject("Did you delete it?\n\n- E")
+
+        assert subject is None
+        assert content == "Did you delete it?\n\n- E"
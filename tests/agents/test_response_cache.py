@@ -0,0 +1,34 @@
+"""Tests for the small-talk response cache."""
+
+from argent.agents.response_cache import ResponseCache, normalize_message
+
+
+class TestResponseCache:
+    """Test reply caching without API calls."""
+
+    def test_normalized_messages_share_an_entry(self):
+        """Test that case, punctuation and spacing don't split entries."""
+        cache = ResponseCache()
+        cache.put((0, 1), "Who are you?", "someone who can help.")
+
+        assert normalize_message("  WHO are   you!! ") == "who are you"
+        assert cache.get((0, 1), "who are you") == "someone who can help."
+
+    def test_context_key_separates_entries(self):
+        """Test that the same message in another context misses."""
+        cache = ResponseCache()
+        cache.put((0, 1), "who are you", "someone who can help.")
+
+        assert cache.get((1, 1), "who are you") is None
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache stays within its size bound."""
+        cache = ResponseCache(max_entries=2)
+        cache.put("ctx", "hi", "a")
+        cache.put("ctx", "hello", "b")
+        cache.get("ctx", "hi")
+        cache.put("ctx", "hey", "c")
+
+        assert cache.get("ctx", "hi") == "a"
+        assert cache.get("ctx", "hello") is None
+        assert cache.get("ctx", "hey") == "c"
@@ -0,0 +1,68 @@
+"""Tests for web inbox endpoints."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from argent.api import inbox
+from argent.api.onboarding import session_serializer
+from argent.config import get_settings
+from argent.database import get_db
+from argent.main import app
+from argent.services.web_inbox import WebInboxService
+
+
+class TestPlayerCache:
+    """Tests for the logged-in player cache."""
+
+    @pytest.fixture
+    def mock_settings(self):
+        """Mock settings with the web inbox enabled."""
+        settings = MagicMock()
+        settings.web_inbox_enabled = True
+        settings.secret_key = "test-secret"
+        return settings
+
+    @pytest.mark.asyncio
+    async def test_cached_player_survives_error_response(self, mock_settings):
+        """Test that a 404 on a cache miss doesn't break the next request."""
+        player_id = uuid4()
+        row = MagicMock(id=player_id, communication_mode="web_only")
+        mock_db = AsyncMock()
+        mock_db.execute.return_value = MagicMock(one_or_none=MagicMock(return_value=row))
+
+        async def override_get_db():
+            try:
+                yield mock_db
+            except Exception:
+                await mock_db.rollback()
+                raise
+
+        app.dependency_overrides[get_settings] = lambda: mock_settings
+        app.dependency_overrides[get_db] = override_get_db
+        inbox._player_cache.clear()
+        cookie = session_serializer(mock_settings.secret_key).dumps(str(player_id))
+
+        try:
+            with patch.object(WebInboxService, "get_message", AsyncMock(return_value=None)):
+                async with AsyncClient(
+                    transport=ASGITransport(app=app),
+                    base_url="http://test",
+                    cookies={"argent_session": cookie},
+                ) as client:
+                    response = await client.get(f"/api/inbox/messages/{uuid4()}")
+                    assert response.status_code == 404
+
+                    response = await client.get(f"/api/inbox/messages/{uuid4()}")
+                    assert response.status_code == 404
+
+            # The second request was served from the cache, which holds
+            # plain values rather than a Player bound to the first session
+            assert mock_db.execute.await_count == 1
+            cached = inbox._player_cache[player_id][1]
+            assert cached == inbox.CurrentPlayer(id=player_id, communication_mode="web_only")
+        finally:
+            app.dependency_overrides.clear()
+            inbox._player_cache.clear()